@@ -1,11 +1,30 @@
 import logging
 import re
+import sys
 import threading
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import partial
+from itertools import compress
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from JABWrapper.jab_types import AccessibleContextInfo, JavaObject
-from JABWrapper.jab_wrapper import JavaAccessBridgeWrapper
+from JABWrapper.jab_wrapper import APIException, JavaAccessBridgeWrapper
 from JABWrapper.parsers.actions_parser import AccessibleActionsParser
 from JABWrapper.parsers.hypertext_parser import AccessibleHypertextParser
 from JABWrapper.parsers.icon_parser import AccessibleIconParser
@@ -15,11 +34,32 @@ from JABWrapper.parsers.selection_parser import AccessibleSelectionParser
 from JABWrapper.parsers.table_parser import AccessibleTableParser
 from JABWrapper.parsers.text_parser import AccessibleTextParser
 from JABWrapper.parsers.value_parser import AccessibleValueParser
-from JABWrapper.utils import SearchElement, log_exec_time, retry_callback
+from JABWrapper.utils import (
+    ExclusiveLock,
+    ReadWriteLock,
+    SearchElement,
+    log_exec_time,
+    retry_callback,
+)
 
 
 @dataclass
 class NodeLocator:
+    # Declared by hand, as dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        "name",
+        "description",
+        "role",
+        "states",
+        "indexInParent",
+        "childrenCount",
+        "x",
+        "y",
+        "width",
+        "height",
+        "ancestry",
+    )
+
     name: str
     description: str
     role: str
@@ -33,64 +73,307 @@ class NodeLocator:
     ancestry: int
 
 
+# The context info fields that are decoded into plain values once per parse
+_NODE_INFO_FIELDS = (
+    "name",
+    "description",
+    "role",
+    "states",
+    "indexInParent",
+    "childrenCount",
+    "x",
+    "y",
+    "width",
+    "height",
+)
+_get_node_info = attrgetter(*_NODE_INFO_FIELDS)
+# The parser attributes of an element and their types, in the printing order
+_PARSER_TYPES: Tuple[Tuple[str, Callable[[AccessibleContextInfo], Parser]], ...] = (
+    ("text", AccessibleTextParser),
+    ("_value", AccessibleValueParser),
+    ("_actions", AccessibleActionsParser),
+    ("keybinds", AccessibleKeyBindingsParser),
+    ("_hypertext", AccessibleHypertextParser),
+    ("_table", AccessibleTableParser),
+    ("_icons", AccessibleIconParser),
+    ("_selections", AccessibleSelectionParser),
+)
+_get_parsers = attrgetter(*(name for name, _ in _PARSER_TYPES))
+# Text and key bindings are loaded from the context snapshot, the rest are queried separately
+_get_detail_parsers = attrgetter("_value", "_actions", "_hypertext", "_table", "_icons", "_selections")
+# The fields drawn from a small vocabulary share a single string object between the elements
+_INTERNED_FIELDS = ("description", "role", "states")
+
+
+def _decode_node_info(context_info: AccessibleContextInfo) -> Dict[str, Any]:
+    attrs = dict(zip(_NODE_INFO_FIELDS, _get_node_info(context_info)))
+    for field in _INTERNED_FIELDS:
+        attrs[field] = sys.intern(attrs[field])
+    return attrs
+
+
+def _source_rank(attrs: Dict[str, Any], source: Optional[Tuple[str, str, int]]) -> int:
+    """
+    Order in which the elements are compared with an event source of the given role, name and index.
+
+    The elements that look the same as the source are compared with the Access Bridge first, then the
+    rest with the same role, and the others only if none of them match, for example when the role has
+    changed. Without the source info every element is compared in the tree order.
+    """
+    if source is None:
+        return 0
+    role, name, index_in_parent = source
+    if attrs["role"] != role:
+        return 2
+    return 0 if attrs["name"] == name and attrs["indexInParent"] == index_in_parent else 1
+
+
+def _is_pattern(search_element: SearchElement) -> bool:
+    return isinstance(search_element.value, str) and not search_element.strict
+
+
+def _compile_search_element(search_element: SearchElement) -> Callable[[Any], bool]:
+    value = search_element.value
+    if _is_pattern(search_element):
+        pattern = re.compile(value)
+
+        def check(attr) -> bool:
+            if isinstance(attr, str):
+                return pattern.match(attr) is not None
+            return attr == value
+
+    else:
+
+        def check(attr) -> bool:
+            return attr == value
+
+    return check
+
+
+def _compile_search_elements(search_elements: List[SearchElement]) -> Callable[["ContextNode"], bool]:
+    """
+    Build a predicate of the search elements once per search instead of resolving the
+    attribute names and regular expressions again for every node.
+    """
+    checks = [
+        (search_element.name, attrgetter(search_element.name), _compile_search_element(search_element))
+        # The cheap equality checks go first, so that most of the nodes are rejected before the regular expressions
+        for search_element in sorted(search_elements, key=_is_pattern)
+    ]
+
+    def match(node: "ContextNode") -> bool:
+        attrs = node._attrs
+        for name, getter, check in checks:
+            try:
+                attr = attrs[name]
+            except KeyError:
+                # Fields outside of the decoded ones are kept for the next searches as well
+                attr = attrs[name] = getter(node._aci)
+            if not check(attr):
+                return False
+        return True
+
+    return match
+
+
 class ContextNode:
+    __slots__ = (
+        "_jab_wrapper",
+        "_lock",
+        "ancestry",
+        "context",
+        "_should_parse_children",
+        "_max_depth",
+        "_executor",
+        "_parallel_depth",
+        "_lazy_children",
+        "_children_parsed",
+        "_lazy_details",
+        "_details_parsed",
+        "_tree",
+        "_children_lock",
+        "_details_lock",
+        "state",
+        "visible_children_count",
+        "virtual_accessible_name",
+        "_children",
+        "_parent_ref",
+        "__weakref__",
+        "_aci",
+        "_attrs",
+        "_roles",
+        "text",
+        "_value",
+        "_actions",
+        "keybinds",
+        "_hypertext",
+        "_table",
+        "_icons",
+        "_selections",
+    )
+
     def __init__(
         self,
         jab_wrapper: JavaAccessBridgeWrapper,
         context: JavaObject,
-        lock: threading.RLock,
+        lock: Optional[Union[ReadWriteLock, ContextManager]] = None,
         ancestry: int = 0,
         parse_children: bool = True,
         max_depth: Optional[int] = None,
         parent: Optional["ContextNode"] = None,
+        executor: Optional[Executor] = None,
+        parallel_depth: int = 1,
+        lazy_children: bool = False,
+        tree: Optional["ContextTree"] = None,
+        lazy_details: bool = False,
+        build_children: bool = True,
     ) -> None:
         self._jab_wrapper = jab_wrapper
+        # The nodes of a tree share the tree lock, a node outside of a tree gets its own. A plain lock
+        # given by the caller is taken by the readers as well.
+        if lock is None:
+            lock = tree._lock if tree is not None else ReadWriteLock()
+        elif not isinstance(lock, (ReadWriteLock, ExclusiveLock)):
+            lock = ExclusiveLock(lock)
         self._lock = lock
         self.ancestry = ancestry
         self.context: JavaObject = context
         self._should_parse_children = parse_children
         self._max_depth = max_depth
+        # Only the nodes above the parallel depth keep the executor, deeper subtrees are built serially.
+        self._executor = executor if ancestry < parallel_depth else None
+        self._parallel_depth = parallel_depth
+        self._lazy_children = lazy_children
+        self._children_parsed = False
+        self._lazy_details = lazy_details
+        self._details_parsed = False
+        self._tree = tree
+        # Guard parsing the lazy children, which happens under the read lock, and the lazy details. Shared by the
+        # nodes of a tree, or by the subtree of a node outside of a tree.
+        if tree is not None:
+            self._children_lock = tree._lazy_children_lock
+            self._details_lock = tree._lazy_details_lock
+        elif parent is not None:
+            self._children_lock = parent._children_lock
+            self._details_lock = parent._details_lock
+        else:
+            self._children_lock = threading.Lock()
+            self._details_lock = threading.Lock()
 
         self.state = None
         self.visible_children_count = 0
         self.virtual_accessible_name = None
-        self._children: list[ContextNode] = []
+        # Replaced as a whole once parsed instead of being modified in place
+        self._children: Tuple[ContextNode, ...] = ()
+        # The roles found in the subtree, collected on the first search that filters by role
+        self._roles: Optional[FrozenSet[str]] = None
+        self.text: Optional[AccessibleTextParser] = None
 
-        self.parent: Optional[ContextNode] = parent
+        self.parent = parent
 
-        # Populate the element with data and its children if enabled.
-        self.refresh()
+        # Populate the element with data and its children if enabled. The node isn't reachable from
+        # the tree yet, so there is no need to take the lock, which also lets worker threads build nodes.
+        # The children of a node built as part of a subtree are left for the subtree builder.
+        self._populate(build_children)
+
+    @property
+    def parent(self) -> Optional["ContextNode"]:
+        # Only a weak reference is kept, so that the refreshed subtrees are freed without the cycle collector
+        return self._parent_ref() if self._parent_ref is not None else None
+
+    @parent.setter
+    def parent(self, parent: Optional["ContextNode"]) -> None:
+        self._parent_ref = weakref.ref(parent) if parent is not None else None
 
     @property
     def children(self):
-        with self._lock:
-            return self._children
+        with self._lock.read():
+            return self._ensure_children()
+
+    def _ensure_children(self) -> Tuple["ContextNode", ...]:
+        if not self._children_parsed:
+            # Lazy children can be parsed by concurrent readers, so only one of them parses while the
+            # others wait. The children are parsed before the flag is set to not expose a partial list.
+            with self._children_lock:
+                if not self._children_parsed:
+                    if self._should_parse_children:
+                        self._parse_children()
+                    self._children_parsed = True
+        return self._children
 
     def parse_context(self) -> None:
-        logging.debug(f"Parsing element={self.context}")
-        self._aci: AccessibleContextInfo = self._jab_wrapper.get_context_info(self.context)
-        logging.debug(f"Parsed element info={self._aci}")
-        self.virtual_accessible_name = self._jab_wrapper.get_virtual_accessible_name(self.context)
-        self.visible_children_count = self._jab_wrapper.get_visible_children_count(self.context)
-        self.text = AccessibleTextParser(self._aci)
-        self.value = AccessibleValueParser(self._aci)
-        self.actions = AccessibleActionsParser(self._aci)
-        self.keybinds = AccessibleKeyBindingsParser(self._aci)
-        self.hypertext = AccessibleHypertextParser(self._aci)
-        self.table = AccessibleTableParser(self._aci)
-        self.icons = AccessibleIconParser(self._aci)
-        self.selections = AccessibleSelectionParser(self._aci)
-        self._parsers: List[Parser] = [
-            self.text,
-            self.value,
-            self.actions,
-            self.keybinds,
-            self.hypertext,
-            self.table,
-            self.icons,
-            self.selections,
-        ]
-        [parser.parse(self._jab_wrapper, self.context) for parser in self._parsers]
+        jab_wrapper = self._jab_wrapper
+        context = self.context
+        logging.debug("Parsing element=%s", context)
+        snapshot = jab_wrapper.get_context_snapshot(context)
+        # The node keeps copies of the structures it needs, so that the snapshot itself is freed
+        aci = AccessibleContextInfo.from_buffer_copy(snapshot.contextInfo)
+        self._aci = aci
+        # Reading a ctypes field copies it out of the structure, so the searched and printed fields are read once
+        attrs = self._attrs = _decode_node_info(aci)
+        self._invalidate_roles()
+        logging.debug("Parsed element info=%s", aci)
+        # Searched together with the element info fields
+        self.virtual_accessible_name = attrs["virtual_accessible_name"] = snapshot.virtualAccessibleName
+        self.visible_children_count = snapshot.visibleChildrenCount
+        if self.text is None:
+            for name, parser_type in _PARSER_TYPES:
+                setattr(self, name, parser_type(aci))
+        else:
+            # Re-parsing the element reuses the parsers instead of allocating new ones
+            for parser in _get_parsers(self):
+                parser.reset(aci)
+        # Text and key bindings were already fetched with the context snapshot.
+        self.text.load(snapshot)
+        self.keybinds.load(snapshot)
+        self._details_parsed = False
+        # Lazy details are parsed on the first access instead.
+        if not self._lazy_details:
+            self._parse_details()
+
+    def _parse_details(self) -> None:
+        jab_wrapper = self._jab_wrapper
+        context = self.context
+        for parser in _get_detail_parsers(self):
+            parser.parse(jab_wrapper, context)
+        self._details_parsed = True
+
+    def _ensure_details(self) -> None:
+        if not self._details_parsed:
+            # Same as with the lazy children, only one of the concurrent readers parses the details
+            with self._details_lock:
+                if not self._details_parsed:
+                    self._parse_details()
+
+    @property
+    def value(self) -> AccessibleValueParser:
+        self._ensure_details()
+        return self._value
+
+    @property
+    def actions(self) -> AccessibleActionsParser:
+        self._ensure_details()
+        return self._actions
+
+    @property
+    def hypertext(self) -> AccessibleHypertextParser:
+        self._ensure_details()
+        return self._hypertext
+
+    @property
+    def table(self) -> AccessibleTableParser:
+        self._ensure_details()
+        return self._table
+
+    @property
+    def icons(self) -> AccessibleIconParser:
+        self._ensure_details()
+        return self._icons
+
+    @property
+    def selections(self) -> AccessibleSelectionParser:
+        self._ensure_details()
+        return self._selections
 
     @property
     def context_info(self) -> AccessibleContextInfo:
@@ -123,139 +406,271 @@ class ContextNode:
     @context_info.setter
     def context_info(self, context_info: AccessibleContextInfo) -> None:
         self._aci = context_info
+        self._attrs = _decode_node_info(context_info)
+        self._attrs["virtual_accessible_name"] = self.virtual_accessible_name
+        self._invalidate_roles()
+        if self._tree is not None:
+            self._tree._invalidate_search_index()
+
+    def _set_info(self, name: str, value) -> None:
+        setattr(self._aci, name, value)
+        value = getattr(self._aci, name)
+        self._attrs[name] = sys.intern(value) if name in _INTERNED_FIELDS else value
+        if name == "role":
+            self._invalidate_roles()
+        if self._tree is not None:
+            self._tree._drop_column(name)
+
+    def _invalidate_roles(self) -> None:
+        # The roles are collected bottom up, so the ancestors of a node without roles have none either
+        node = self
+        while node is not None and node._roles is not None:
+            node._roles = None
+            node = node.parent
+
+    def _subtree_roles(self) -> FrozenSet[str]:
+        roles = self._roles
+        if roles is None:
+            # Collected without recursion, the nodes are visited in pre-order and their roles set in reverse
+            # so that the children are done before their parent
+            stack = [self]
+            pending = []
+            while stack:
+                node = stack.pop()
+                if node._roles is None:
+                    pending.append(node)
+                    stack.extend(node._ensure_children())
+            for node in reversed(pending):
+                node._roles = frozenset((node._attrs["role"],)).union(*(child._roles for child in node._children))
+            roles = self._roles
+        return roles
 
     def _parse_children(self) -> None:
         if self._max_depth is not None and self.ancestry >= self._max_depth:
             return
 
-        for i in range(0, self._aci.childrenCount):
-            child_context = self._jab_wrapper.get_child_context(self.context, i)
-            child_node = ContextNode(
-                self._jab_wrapper,
-                child_context,
-                self._lock,
-                self.ancestry + 1,
-                parse_children=self._should_parse_children,
-                max_depth=self._max_depth,
-                parent=self,
+        child_contexts = self._jab_wrapper.get_child_contexts(self.context, 0, self._attrs["childrenCount"])
+        if self._executor is not None and self.ancestry + 1 >= self._parallel_depth and child_contexts:
+            # Fork the sibling subtrees into the pool. Only this thread waits for the results, so the
+            # workers never block on each other. The first subtree is built here instead of idling.
+            futures = [self._executor.submit(self._create_child, child_context) for child_context in child_contexts[1:]]
+            first = self._create_child(child_contexts[0])
+            self._children = (first, *(future.result() for future in futures))
+        else:
+            self._children = tuple(
+                self._create_child(child_context, build_children=False) for child_context in child_contexts
             )
-            self._children.append(child_node)
 
-    def refresh(self):
+    def _build_children(self) -> None:
+        # The subtree is built one node at a time from a work stack instead of recursing through the child
+        # constructors, so that deep trees don't run into the recursion limit
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._should_parse_children:
+                node._parse_children()
+                # The forked subtrees are already built by the workers
+                stack.extend(
+                    child
+                    for child in reversed(node._children)
+                    if not child._children_parsed and not child._lazy_children
+                )
+            node._children_parsed = True
+
+    def _create_child(self, child_context: JavaObject, build_children: bool = True) -> "ContextNode":
+        return ContextNode(
+            self._jab_wrapper,
+            child_context,
+            self._lock,
+            self.ancestry + 1,
+            parse_children=self._should_parse_children,
+            max_depth=self._max_depth,
+            parent=self,
+            executor=self._executor,
+            parallel_depth=self._parallel_depth,
+            lazy_children=self._lazy_children,
+            tree=self._tree,
+            lazy_details=self._lazy_details,
+            build_children=build_children,
+        )
+
+    def _populate(self, build_children: bool = True) -> None:
+        self.state = None
+        self._children = ()
+        self._children_parsed = False
+        self.parse_context()
+        # Lazy children are parsed on the first access instead.
+        if not self._lazy_children and build_children:
+            self._build_children()
+
+    def refresh(self, deep: bool = True):
         """Refresh the current element and its children only.
 
         Useful when you want to refresh just a subtree of elements starting from the
         current one as root, instead of the entire app.
+
+        Args:
+            deep: re-parse every element of the subtree. Otherwise only the elements whose
+                context info or children have changed are re-parsed with their subtrees, and the
+                rest keep their parsed text, value, actions and other details.
         """
-        with self._lock:
-            self.state = None
-            self._children.clear()
-            self.parse_context()
-            if self._should_parse_children:
-                self._parse_children()
+        with self._lock.write():
+            if self._tree is not None:
+                self._tree._invalidate_search_index()
+            if deep:
+                self._populate()
+            else:
+                self._refresh_changed()
+
+    def _refresh_changed(self, reparse: Sequence["ContextNode"] = ()) -> None:
+        get_context_info = self._jab_wrapper.get_context_info
+        reparse_ids = {id(node) for node in reparse}
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            context_info = get_context_info(node.context)
+            if _get_node_info(context_info) != _get_node_info(node._aci) or node._children_replaced():
+                node._populate()
+                continue
+            # Only the requested elements are re-parsed, the other unchanged descendants are kept as is
+            if id(node) in reparse_ids:
+                node.parse_context()
+            stack.extend(reversed(node._children))
+
+    def _children_replaced(self) -> bool:
+        # The children can be replaced by other elements while the count stays the same, and the old handles
+        # would still be readable. Only the parsed children are compared, the rest are parsed when accessed.
+        children = self._children
+        if not children:
+            return False
+        child_contexts = self._jab_wrapper.get_child_contexts(self.context, 0, len(children))
+        if len(child_contexts) != len(children):
+            return True
+        is_same_object = self._jab_wrapper.is_same_object
+        return not all(map(is_same_object, (child.context for child in children), child_contexts))
 
     def __repr__(self) -> str:
         """
         Returns:
             A string that represents the object tree with detailed Node values.
         """
-        string = (
-            f"{'| ' * self.ancestry}"
-            f"role:{self.context_info.role}; "
-            f"name:{self.context_info.name}; "
-            f"virtual_accessible_name:{self.virtual_accessible_name}; "
-            f"description:{self.context_info.description}; "
-            f"ancestry:{self.ancestry}; "
-            f"state:{self.state}; "
-            f"states:{self.context_info.states}; "
-            f"at x:{self.context_info.x} y:{self.context_info.y}; "
-            f"width:{self.context_info.width}; "
-            f"height:{self.context_info.height}; "
-            f"indexInParent:{self.context_info.indexInParent}; "
-            f"childrenCount:{self.context_info.childrenCount}; "
-            f"visible_children_count:{self.visible_children_count}"
-        )
-        for parser in self._parsers:
-            string += f"{parser}"
-        for child in self.children:
-            string += f"\n{repr(child)}"
-        return string
+        with self._lock.read():
+            return "\n".join(f"{'| ' * node.ancestry}{node}" for node in self._walk())
 
     def __str__(self) -> str:
         """
         Returns:
             A string of Node values.
         """
+        attrs = self._attrs
         string = (
-            f"role:{self.context_info.role}; "
-            f"name:{self.context_info.name}; "
+            f"role:{attrs['role']}; "
+            f"name:{attrs['name']}; "
             f"virtual_accessible_name:{self.virtual_accessible_name}; "
-            f"description:{self.context_info.description}; "
+            f"description:{attrs['description']}; "
             f"ancestry:{self.ancestry}; "
             f"state:{self.state}; "
-            f"states:{self.context_info.states}; "
-            f"at x:{self.context_info.x} y:{self.context_info.y}; "
-            f"width:{self.context_info.width}; "
-            f"height:{self.context_info.height}; "
-            f"indexInParent:{self.context_info.indexInParent}; "
-            f"childrenCount:{self.context_info.childrenCount}; "
+            f"states:{attrs['states']}; "
+            f"at x:{attrs['x']} y:{attrs['y']}; "
+            f"width:{attrs['width']}; "
+            f"height:{attrs['height']}; "
+            f"indexInParent:{attrs['indexInParent']}; "
+            f"childrenCount:{attrs['childrenCount']}; "
             f"visible_children_count:{self.visible_children_count}"
+            f"{self._parsers_str()}"
         )
-        for parser in self._parsers:
-            string += "{}".format(parser)
         return string
 
+    def _parsers_str(self) -> str:
+        return (
+            f"{self.text}{self.value}{self.actions}{self.keybinds}"
+            f"{self.hypertext}{self.table}{self.icons}{self.selections}"
+        )
+
     def get_search_element_tree(self) -> List[NodeLocator]:
         """
         Returns node info for all searchable elements.
         """
-        nodes = []
-        nodes.append(
-            NodeLocator(
-                self.context_info.name,
-                self.context_info.description,
-                self.context_info.role,
-                self.context_info.states,
-                self.context_info.indexInParent,
-                self.context_info.childrenCount,
-                self.context_info.x,
-                self.context_info.y,
-                self.context_info.width,
-                self.context_info.height,
-                self.ancestry,
-            )
-        )
-        for child in self.children:
-            nodes.extend(child.get_search_element_tree())
-        return nodes
+        with self._lock.read():
+            return [
+                NodeLocator(*[node._attrs[field] for field in _NODE_INFO_FIELDS], node.ancestry)
+                for node in self._walk()
+            ]
 
     def traverse(self):
-        yield self
-        for child in self.children:
-            yield from child.traverse()
+        # Depth first in tree order without the nested generators of a recursive traversal
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
 
     def __iter__(self):
         return self.traverse()
 
     def _get_node_by_context(self, context: JavaObject):
-        if self._jab_wrapper.is_same_object(self.context, context):
-            return self
-        else:
-            for child in self._children:
-                node = child._get_node_by_context(context)
-                if node:
+        is_same_object = self._jab_wrapper.is_same_object
+        handle = context.value
+        try:
+            info = self._jab_wrapper.get_context_info(context)
+            source = (info.role, info.name, info.indexInParent)
+        except APIException:
+            source = None
+        later: Tuple[List[ContextNode], List[ContextNode]] = ([], [])
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            # A node with the same handle value is compared first, the value alone could belong to another object
+            rank = 0 if node.context.value == handle else _source_rank(node._attrs, source)
+            if not rank:
+                if is_same_object(node.context, context):
                     return node
-
-    def _match_attrs(self, search_elements: List[SearchElement]) -> bool:
-        for search_element in search_elements:
-            attr = getattr(self._aci, search_element.name)
-            if isinstance(attr, str) and not search_element.strict:
-                if not re.match(search_element.value, attr):
-                    return False
             else:
-                if not attr == search_element.value:
-                    return False
-        return True
+                later[rank - 1].append(node)
+            # Reversed to keep visiting the children in the same pre-order as before.
+            stack.extend(reversed(node._children))
+        for node in (*later[0], *later[1]):
+            if is_same_object(node.context, context):
+                return node
+
+    def _walk(self) -> Iterator["ContextNode"]:
+        # Same order as traverse, for the callers that already hold the lock
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node._ensure_children()))
+
+    def _collect(
+        self,
+        match: Callable[["ContextNode"], bool],
+        out: List["ContextNode"],
+        role: Optional[SearchElement] = None,
+    ) -> None:
+        if role is None:
+            out.extend(node for node in self._walk() if match(node))
+            return
+        # The subtrees without any matching role are skipped as a whole
+        check = _compile_search_element(role)
+        checked: Dict[str, bool] = {}
+
+        def has_role(roles: FrozenSet[str]) -> bool:
+            for value in roles:
+                found = checked.get(value)
+                if found is None:
+                    found = checked[value] = check(value)
+                if found:
+                    return True
+            return False
+
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if not has_role(node._subtree_roles()):
+                continue
+            if match(node):
+                out.append(node)
+            stack.extend(reversed(node._ensure_children()))
 
     def get_by_attrs(self, search_elements: List[SearchElement]) -> List:
         """
@@ -265,31 +680,30 @@ class ContextNode:
 
         element = context_tree.get_by_attrs([SearchElement("role", "text")])
 
+        The virtual accessible name is searched with the "virtual_accessible_name" field name.
+
         Returns:
             An array of matching elements.
         """
-        with self._lock:
-            elements = list()
-            found = self._match_attrs(search_elements)
-            if found:
-                elements.append(self)
-            for child in self._children:
-                child_elements = child.get_by_attrs(search_elements)
-                elements.extend(child_elements)
-            return elements
+        match = _compile_search_elements(search_elements)
+        role = next((element for element in search_elements if element.name == "role"), None)
+        elements = []
+        with self._lock.read():
+            self._collect(match, elements, role)
+        return elements
 
     def request_focus(self) -> None:
         """
         Request focus for element
         """
-        with self._lock:
+        with self._lock.write():
             self._jab_wrapper.request_focus(self.context)
 
     def get_actions(self) -> List[str]:
         """
         Get all actions available for element
         """
-        with self._lock:
+        with self._lock.read():
             return self.actions.list_actions()
 
     def do_action(self, action: str) -> None:
@@ -298,21 +712,21 @@ class ContextNode:
 
         Will raise APIException if action is not available
         """
-        with self._lock:
+        with self._lock.write():
             self.actions.do_action(self._jab_wrapper, self.context, action)
 
     def click(self) -> None:
         """
         Do click action for element
         """
-        with self._lock:
+        with self._lock.write():
             self.actions.click(self._jab_wrapper, self.context)
 
     def insert_text(self, text: str) -> None:
         """
         Do insert content action for element
         """
-        with self._lock:
+        with self._lock.write():
             self.actions.insert_content(self._jab_wrapper, self.context, text)
 
     def get_visible_children(self) -> List:
@@ -328,14 +742,15 @@ class ContextNode:
             APIException: Failed to get visible children info
         """
         visible_children = []
-        logging.debug(f"Expected visible children count={self.visible_children_count}")
+        logging.debug("Expected visible children count=%s", self.visible_children_count)
         if self.visible_children_count > 0:
             visible_children_info = self._jab_wrapper.get_visible_children(self.context, 0)
-            logging.debug(f"Found visible children count={self.visible_children_count}")
-            for i in range(0, visible_children_info.returnedChildrenCount):
+            logging.debug("Found visible children count=%s", self.visible_children_count)
+            # A single slice copies out the returned handles instead of indexing the array per child
+            for child_context in visible_children_info.children[: visible_children_info.returnedChildrenCount]:
                 visible_child = ContextNode(
                     self._jab_wrapper,
-                    visible_children_info.children[i],
+                    child_context,
                     self._lock,
                     self.ancestry + 1,
                     parse_children=False,
@@ -346,15 +761,115 @@ class ContextNode:
 
 
 class ContextTree:
+    # Handler method names by the callback name
+    _CALLBACKS: Dict[str, str] = {
+        # Property change event handlers
+        "property_change": "_property_change_cp",
+        "property_state_change": "_property_state_change_cp",
+        "property_value_change": "_property_value_change_cp",
+        "property_selection_change": "_property_selection_change_cp",
+        "property_text_change": "_property_text_change_cp",
+        "property_visible_data_change": "_visible_data_change_cp",
+    }
+
+    # Context info fields by the callback name, all handled by _info_change_cp
+    _INFO_CALLBACKS: Dict[str, str] = {
+        "property_name_change": "name",
+        "property_description_change": "description",
+    }
+
+    # Callbacks that are only logged by _ignored_cp, registered only when debug logging is enabled
+    _IGNORED_CALLBACKS: Tuple[str, ...] = (
+        # Caret information is not stored in the node component
+        "property_caret_change",
+        # Not needed to track as the visibility change event handles the coordinate update
+        "property_child_change",
+        # The activity status is not stored inside the tree model
+        "property_active_descendent_change",
+        # TODO: Add table model parsing
+        "property_table_model_change",
+        # All menu events can be ignored as the visibility change event already gives needed information update
+        # to the context tree
+        "menu_selected",
+        "menu_deselected",
+        "menu_canceled",
+        # Focus state information is not stored in the context tree
+        "focus_gained",
+        "focus_lost",
+        # Caret information is not stored in the context tree
+        "caret_update",
+        # Ignore the mouse events, as the change events will update the context tree
+        "mouse_clicked",
+        "mouse_entered",
+        "mouse_exited",
+        "mouse_pressed",
+        "mouse_released",
+        # Ignore the popup events
+        "popup_menu_canceled",
+        "popup_menu_will_become_invisible",
+        "popup_menu_will_become_visible",
+    )
+
     @log_exec_time("Init context tree")
-    def __init__(self, jab_wrapper: JavaAccessBridgeWrapper, max_depth: Optional[int] = None) -> None:
-        self._lock = threading.RLock()
+    def __init__(
+        self,
+        jab_wrapper: JavaAccessBridgeWrapper,
+        max_depth: Optional[int] = None,
+        workers: Optional[int] = None,
+        parallel_depth: int = 1,
+        lazy_children: bool = False,
+        debounce: Optional[float] = None,
+        lazy_details: bool = False,
+    ) -> None:
+        """
+        Args:
+            jab_wrapper: the wrapper attached to the application window.
+            max_depth: optional maximum depth of the parsed element tree.
+            workers: optional number of threads used for building the sibling subtrees concurrently.
+                By default the whole tree is built serially on the calling thread.
+            parallel_depth: the depth from which on the subtrees are built by the workers.
+            lazy_children: parse the children of each element only when they are first accessed.
+                Elements that have not been accessed yet aren't updated by the event callbacks.
+            debounce: optional time in seconds for coalescing the events that re-parse elements. The
+                elements are then updated on a timer thread once per burst instead of once per event.
+            lazy_details: query the value, actions, hypertext, table, icons and selections of each element
+                only when they are first accessed. The searches don't need them.
+        """
+        # Searches and other reads run concurrently, refreshes, actions and the callbacks are exclusive
+        self._lock = ReadWriteLock()
         self._jab_wrapper = jab_wrapper
-        self.root = ContextNode(jab_wrapper, jab_wrapper.context, self._lock, parse_children=True, max_depth=max_depth)
+        self._debounce = debounce
+        # Pending element updates by the node identity, with whether the subtree needs a refresh. The event
+        # sources are usually new handles for each event, so they are resolved to the nodes when scheduled.
+        self._pending_updates: Dict[int, Tuple[ContextNode, bool]] = {}
+        self._pending_lock = threading.Lock()
+        # Only the lazy parsing of the same tree waits for each other
+        self._lazy_children_lock = threading.Lock()
+        self._lazy_details_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ContextTree") if workers else None
+        self.root = ContextNode(
+            jab_wrapper,
+            jab_wrapper.context,
+            parse_children=True,
+            max_depth=max_depth,
+            executor=self._executor,
+            parallel_depth=parallel_depth,
+            lazy_children=lazy_children,
+            tree=self,
+            lazy_details=lazy_details,
+        )
+        # Flat tree order list of the nodes with a column of values per searched context info field,
+        # and the node positions by role. Built on the first search.
+        self._nodes: Optional[List[ContextNode]] = None
+        self._columns: Dict[str, List[Any]] = {}
+        self._role_index: Optional[Dict[str, List[int]]] = None
         self._register_callbacks()
 
     def __iter__(self):
-        return self.root.traverse()
+        # Iterates the flat node list shared with the searches, which is taken under a single lock
+        with self._lock.read():
+            return iter(list(self._get_nodes()))
 
     def __repr__(self) -> str:
         return f"{repr(self.root)}"
@@ -362,164 +877,252 @@ class ContextTree:
     def __str__(self):
         return f"{self.root}"
 
-    def get_search_element_tree(self):
-        return self.root.get_search_element_tree()
-
-    @retry_callback
-    def _property_change_cp(self, source: JavaObject, property: str, old_value: str, new_value: str) -> None:
-        with self._lock:
-            node: ContextNode = self.root._get_node_by_context(source)
-            if node:
-                setattr(node.context_info, property, new_value)
-                logging.debug(f"Property={property} changed from={old_value} to={new_value} for node={node}")
-
-    @retry_callback
-    def _property_name_change_cp(self, source: JavaObject, old_value: str, new_value: str) -> None:
-        with self._lock:
-            node: ContextNode = self.root._get_node_by_context(source)
-            if node:
-                setattr(node.context_info, "name", new_value)
-                logging.debug(f"Name changed from={old_value} to={new_value} for node={node}")
-
-    @retry_callback
-    def _property_description_change_cp(self, source: JavaObject, old_value: str, new_value: str) -> None:
-        with self._lock:
-            node: ContextNode = self.root._get_node_by_context(source)
-            if node:
-                setattr(node.context_info, "description", new_value)
-                logging.debug(f"Description changed from={old_value} to={new_value} for node={node}")
-
-    @retry_callback
-    def _property_state_change_cp(self, source: JavaObject, old_value: str, new_value: str) -> None:
-        with self._lock:
-            node: ContextNode = self.root._get_node_by_context(source)
-            if node:
-                node.state = new_value
-                logging.debug(f"State changed from={old_value} to={new_value} for node={node}")
-
-    @retry_callback
-    def _property_value_change_cp(self, source: JavaObject, old_value: str, new_value: str) -> None:
-        with self._lock:
-            node: ContextNode = self.root._get_node_by_context(source)
-            if node:
-                node.value.value = new_value
-                logging.debug(f"Value changed from={old_value} to={new_value} for node={node}")
-
-    @retry_callback
-    def _property_selection_change_cp(self, source: JavaObject) -> None:
-        with self._lock:
-            node: ContextNode = self.root._get_node_by_context(source)
-            if node:
-                node.parse_context()
-                logging.debug(f"Selected text changed for node={node}")
+    def get_search_element_tree(self) -> List[NodeLocator]:
+        """
+        Returns node info for all searchable elements.
+        """
+        with self._lock.read():
+            columns = [self._get_column(field) for field in _NODE_INFO_FIELDS]
+            return [NodeLocator(*values, node.ancestry) for node, *values in zip(self._get_nodes(), *columns)]
 
-    @retry_callback
-    def _property_text_change_cp(self, source: JavaObject) -> None:
-        with self._lock:
-            node: ContextNode = self.root._get_node_by_context(source)
-            if node:
-                node.parse_context()
-                logging.debug(f"Text changed for node={node}")
+    def get_search_element_columns(self) -> Dict[str, List[Any]]:
+        """
+        Returns node info for all searchable elements as a list of values per field, in the same
+        order as `get_search_element_tree`. For example:
 
-    @retry_callback
-    def _property_caret_change_cp(self, source: JavaObject, old_pos: int, new_pos: int) -> None:
-        # Caret information is not stored in the node component
-        logging.debug("Property caret change event ignored")
+        columns = context_tree.get_search_element_columns()
+        buttons = [name for name, role in zip(columns["name"], columns["role"]) if role == "push button"]
+        """
+        with self._lock.read():
+            columns = {field: list(self._get_column(field)) for field in _NODE_INFO_FIELDS}
+            columns["ancestry"] = [node.ancestry for node in self._get_nodes()]
+        return columns
 
-    @retry_callback
-    def _visible_data_change_cp(self, source: JavaObject) -> None:
-        with self._lock:
-            node = self.root._get_node_by_context(source)
-            if node:
-                node.refresh()
-                logging.debug(f"Visible data changed for node tree={repr(node)}")
+    def refresh(self, deep: bool = True) -> None:
+        """
+        Refresh the whole element tree.
 
-    @retry_callback
-    def _property_child_change_cp(self, source: JavaObject, old_child: JavaObject, new_child: JavaObject) -> None:
-        # Not needed to track as the visibility change event handles the coordinate update
-        logging.debug("Property child change event ignored")
+        Args:
+            deep: re-parse every element. Otherwise only the changed elements are re-parsed,
+                see `ContextNode.refresh`.
+        """
+        with self._lock.write():
+            self.root.refresh(deep)
 
-    @retry_callback
-    def _property_active_descendent_change_cp(
-        self, source: JavaObject, old_child: JavaObject, new_child: JavaObject
-    ) -> None:
-        # The activity status is not stored inside the tree model
-        logging.debug("Property active descendent change event ignored")
+    def batch(self) -> ContextManager:
+        """
+        Hold the tree lock over several actions, searches or refreshes. The callbacks wait until
+        the batch is done and the calls within it only bump the lock depth instead of locking again.
 
-    @retry_callback
-    def _property_table_model_change_cp(self, source: JavaObject, old_value: str, new_value: str) -> None:
-        # TODO: Add table model parsing
-        logging.debug("Property table model change event ignored")
+        with context_tree.batch():
+            for node in context_tree.get_by_attrs([SearchElement("role", "check box")]):
+                node.click()
+        """
+        return self._lock.write()
 
-    @retry_callback
-    def _menu_selected_cp(self, source: JavaObject) -> None:
-        # All menu events can be ignored as the visibility change event already gives needed information update to the context tree
-        logging.debug("Menu selected event ignored")
+    def shutdown(self) -> None:
+        """
+        Stop the tree building worker threads and drop the pending debounced updates.
 
-    @retry_callback
-    def _menu_deselected_cp(self, source: JavaObject) -> None:
-        # All menu events can be ignored as the visibility change event already gives needed information update to the context tree
-        logging.debug("Menu deselected event ignored")
+        The tree stays usable, the later refreshes and lazily parsed children are built serially.
+        """
+        with self._pending_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._pending_updates.clear()
+        executor = self._executor
+        if executor is None:
+            return
+        # Detached under the write lock, so that no refresh or lazy parse is submitting to the pool
+        with self._lock.write():
+            self._executor = None
+            stack = [self.root]
+            while stack:
+                node = stack.pop()
+                node._executor = None
+                stack.extend(node._children)
+        executor.shutdown(wait=True)
+
+    def _invalidate_search_index(self) -> None:
+        self._nodes = None
+        self._columns = {}
+        self._role_index = None
+
+    def _drop_column(self, name: str) -> None:
+        self._columns.pop(name, None)
+        if name == "role":
+            self._role_index = None
+
+    def _get_nodes(self) -> List[ContextNode]:
+        if self._nodes is None:
+            self._nodes = list(self.root._walk())
+        return self._nodes
+
+    def _get_column(self, name: str) -> List[Any]:
+        column = self._columns.get(name)
+        if column is None:
+            getter = attrgetter(name)
+            column = self._columns[name] = [
+                node._attrs[name] if name in node._attrs else getter(node._aci) for node in self._get_nodes()
+            ]
+        return column
+
+    def _get_role_index(self) -> Dict[str, List[int]]:
+        if self._role_index is None:
+            role_index: Dict[str, List[int]] = {}
+            for position, role in enumerate(self._get_column("role")):
+                role_index.setdefault(role, []).append(position)
+            self._role_index = role_index
+        return self._role_index
+
+    def _get_node(self, source: JavaObject) -> Optional[ContextNode]:
+        """
+        Find the node of the callback source.
 
-    @retry_callback
-    def _menu_canceled_cp(self, source: JavaObject) -> None:
-        # All menu events can be ignored as the visibility change event already gives needed information update to the context tree
-        logging.debug("Menu canceled event ignored")
+        The event sources are usually new handles for the same Java objects, so the handles can't be looked
+        up from an index and the tree is searched with the Access Bridge instead.
+        """
+        return self.root._get_node_by_context(source)
 
-    @retry_callback
-    def _focus_gained_cp(self, source: JavaObject) -> None:
-        # State information is not stored in the context tree
-        logging.debug("Focus gained event ignored")
+    def _change_info(self, name: str, source: JavaObject, old_value: str, new_value: str) -> None:
+        with self._lock.write():
+            node: ContextNode = self._get_node(source)
+            if node:
+                node._set_info(name, new_value)
+                logging.debug("Property=%s changed from=%s to=%s for node=%s", name, old_value, new_value, node)
 
     @retry_callback
-    def _focus_lost_cp(self, source: JavaObject) -> None:
-        # State information is not stored in the context tree
-        logging.debug("Focus lost event ignored")
+    def _property_change_cp(self, source: JavaObject, property: str, old_value: str, new_value: str) -> None:
+        self._change_info(property, source, old_value, new_value)
 
     @retry_callback
-    def _caret_update_cp(self, source: JavaObject) -> None:
-        # Caret information is not stored in the context tree
-        logging.debug("Caret update event ignored")
+    def _info_change_cp(self, name: str, source: JavaObject, old_value: str, new_value: str) -> None:
+        self._change_info(name, source, old_value, new_value)
 
     @retry_callback
-    def _mouse_clicked_cp(self, source: JavaObject) -> None:
-        # Ignore the mouse events, as the change events will update the context tree
-        logging.debug("mouse clicked event ignored")
+    def _property_state_change_cp(self, source: JavaObject, old_value: str, new_value: str) -> None:
+        with self._lock.write():
+            node: ContextNode = self._get_node(source)
+            if node:
+                node.state = new_value
+                logging.debug("State changed from=%s to=%s for node=%s", old_value, new_value, node)
 
     @retry_callback
-    def _mouse_entered_cp(self, source: JavaObject) -> None:
-        # Ignore the mouse events, as the change events will update the context tree
-        logging.debug("mouse entered event ignored")
+    def _property_value_change_cp(self, source: JavaObject, old_value: str, new_value: str) -> None:
+        with self._lock.write():
+            node: ContextNode = self._get_node(source)
+            if node:
+                node.value.value = new_value
+                logging.debug("Value changed from=%s to=%s for node=%s", old_value, new_value, node)
 
-    @retry_callback
-    def _mouse_exited_cp(self, source: JavaObject) -> None:
-        # Ignore the mouse events, as the change events will update the context tree
-        logging.debug("mouse exited event ignored")
+    def _update_node(self, source: JavaObject, refresh: bool) -> Optional[ContextNode]:
+        with self._lock.write():
+            node = self._get_node(source)
+            if node:
+                self._reparse_node(node, refresh)
+            return node
+
+    def _reparse_node(self, node: ContextNode, refresh: bool, descendants: Sequence[ContextNode] = ()) -> None:
+        if refresh:
+            # Most of the visible data changes are redraws without any changes in the elements, so only
+            # the source, the changed elements below it and the given descendants are re-parsed
+            node._refresh_changed(reparse=(node, *descendants))
+        else:
+            node.parse_context()
+        self._invalidate_search_index()
+
+    def _is_attached(self, node: ContextNode) -> bool:
+        while True:
+            parent = node.parent
+            if parent is None:
+                return node is self.root
+            if not any(child is node for child in parent._children):
+                return False
+            node = parent
+
+    def _schedule_update(self, source: JavaObject, refresh: bool) -> None:
+        with self._lock.read():
+            node = self._get_node(source)
+        if node is None:
+            return
+        with self._pending_lock:
+            _, pending_refresh = self._pending_updates.get(id(node), (node, False))
+            self._pending_updates[id(node)] = (node, refresh or pending_refresh)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._debounce, self._flush_updates)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush_updates(self) -> None:
+        with self._pending_lock:
+            pending_updates = self._pending_updates
+            self._pending_updates = {}
+            self._flush_timer = None
+        logging.debug("Updating %s debounced elements", len(pending_updates))
+        with self._lock.read():
+            updates = self._group_updates(pending_updates.values())
+        for node, refresh, descendants in updates:
+            self._flush_update(node, refresh, descendants)
+
+    @staticmethod
+    def _group_updates(
+        pending_updates: Iterable[Tuple[ContextNode, bool]]
+    ) -> List[Tuple[ContextNode, bool, List[ContextNode]]]:
+        """
+        Order the updates from the ancestors down and fold the elements below a refreshed ancestor into
+        its update, as the refresh walks them anyway.
+        """
+        updates = []
+        refreshes: Dict[int, List[ContextNode]] = {}
+        for node, refresh in sorted(pending_updates, key=lambda update: update[0].ancestry):
+            ancestor = node.parent
+            while ancestor is not None and id(ancestor) not in refreshes:
+                ancestor = ancestor.parent
+            if ancestor is not None:
+                refreshes[id(ancestor)].append(node)
+                continue
+            descendants: List[ContextNode] = []
+            if refresh:
+                refreshes[id(node)] = descendants
+            updates.append((node, refresh, descendants))
+        return updates
 
     @retry_callback
-    def _mouse_pressed_cp(self, source: JavaObject) -> None:
-        # Ignore the mouse events, as the change events will update the context tree
-        logging.debug("mouse pressed event ignored")
+    def _flush_update(self, node: ContextNode, refresh: bool, descendants: Sequence[ContextNode]) -> None:
+        with self._lock.write():
+            if self._is_attached(node):
+                self._reparse_node(node, refresh, descendants)
 
     @retry_callback
-    def _mouse_released_cp(self, source: JavaObject) -> None:
-        # Ignore the mouse events, as the change events will update the context tree
-        logging.debug("mouse released event ignored")
+    def _property_selection_change_cp(self, source: JavaObject) -> None:
+        if self._debounce is not None:
+            self._schedule_update(source, refresh=False)
+            return
+        node = self._update_node(source, refresh=False)
+        if node:
+            logging.debug("Selected text changed for node=%s", node)
 
     @retry_callback
-    def _popup_menu_canceled_cp(self, source: JavaObject) -> None:
-        # Ignore the popup events
-        logging.debug("popup menu canceled event ignored")
+    def _property_text_change_cp(self, source: JavaObject) -> None:
+        if self._debounce is not None:
+            self._schedule_update(source, refresh=False)
+            return
+        node = self._update_node(source, refresh=False)
+        if node:
+            logging.debug("Text changed for node=%s", node)
 
     @retry_callback
-    def _popup_menu_will_become_invisible_cp(self, source: JavaObject) -> None:
-        # Ignore the popup events
-        logging.debug("popup menu will become invisible event ignored")
+    def _visible_data_change_cp(self, source: JavaObject) -> None:
+        if self._debounce is not None:
+            self._schedule_update(source, refresh=True)
+            return
+        node = self._update_node(source, refresh=True)
+        if node:
+            logging.debug("Visible data changed for node=%s", node)
 
-    @retry_callback
-    def _popup_menu_will_become_visible_cp(self, source: JavaObject) -> None:
-        # Ignore the popup events
-        logging.debug("popup menu will become visible event ignored")
+    def _ignored_cp(self, name: str, *args) -> None:
+        logging.debug("Callback=%s ignored", name)
 
     def _register_callbacks(self) -> None:
         """
@@ -532,42 +1135,12 @@ class ContextTree:
 
         self._jab_wrapper.clear_callbacks()
 
-        # Property change event handlers
-        self._jab_wrapper.register_callback("property_change", self._property_change_cp)
-        self._jab_wrapper.register_callback("property_name_change", self._property_name_change_cp)
-        self._jab_wrapper.register_callback("property_description_change", self._property_description_change_cp)
-        self._jab_wrapper.register_callback("property_state_change", self._property_state_change_cp)
-        self._jab_wrapper.register_callback("property_value_change", self._property_value_change_cp)
-        self._jab_wrapper.register_callback("property_selection_change", self._property_selection_change_cp)
-        self._jab_wrapper.register_callback("property_text_change", self._property_text_change_cp)
-        self._jab_wrapper.register_callback("property_caret_change", self._property_caret_change_cp)
-        self._jab_wrapper.register_callback("property_visible_data_change", self._visible_data_change_cp)
-        self._jab_wrapper.register_callback("property_child_change", self._property_child_change_cp)
-        self._jab_wrapper.register_callback(
-            "property_active_descendent_change", self._property_active_descendent_change_cp
-        )
-        self._jab_wrapper.register_callback("property_table_model_change", self._property_table_model_change_cp)
-        # Menu event handlers
-        self._jab_wrapper.register_callback("menu_selected", self._menu_selected_cp)
-        self._jab_wrapper.register_callback("menu_deselected", self._menu_deselected_cp)
-        self._jab_wrapper.register_callback("menu_calceled", self._menu_canceled_cp)
-        # Focus event handlers
-        self._jab_wrapper.register_callback("focus_gained", self._focus_gained_cp)
-        self._jab_wrapper.register_callback("focus_lost", self._focus_lost_cp)
-        # Caret update event handler
-        self._jab_wrapper.register_callback("caret_update", self._caret_update_cp)
-        # Mouse events
-        self._jab_wrapper.register_callback("mouse_clicked", self._mouse_clicked_cp)
-        self._jab_wrapper.register_callback("mouse_entered", self._mouse_entered_cp)
-        self._jab_wrapper.register_callback("mouse_exited", self._mouse_exited_cp)
-        self._jab_wrapper.register_callback("mouse_pressed", self._mouse_pressed_cp)
-        self._jab_wrapper.register_callback("mouse_released", self._mouse_released_cp)
-        # Popup menu events
-        self._jab_wrapper.register_callback("popup_menu_canceled", self._popup_menu_canceled_cp)
-        self._jab_wrapper.register_callback(
-            "popup_menu_will_become_invisible", self._popup_menu_will_become_invisible_cp
-        )
-        self._jab_wrapper.register_callback("popup_menu_will_become_visible", self._popup_menu_will_become_visible_cp)
+        callbacks = {name: getattr(self, method_name) for name, method_name in self._CALLBACKS.items()}
+        callbacks.update({name: partial(self._info_change_cp, field) for name, field in self._INFO_CALLBACKS.items()})
+        # The mouse, focus and other frequent events would call into Python only to be ignored
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            callbacks.update({name: partial(self._ignored_cp, name) for name in self._IGNORED_CALLBACKS})
+        self._jab_wrapper.register_callbacks(callbacks)
 
     def get_by_attrs(self, search_elements: List[SearchElement]) -> List[ContextNode]:
         """
@@ -578,6 +1151,33 @@ class ContextTree:
         The SearchElement object takes a name of the field and the field value:
         element = context_tree.get_by_attrs([SearchElement("role", "text")])
 
+        The virtual accessible name is searched with the "virtual_accessible_name" field name.
+
         Returns an array of matching elements.
         """
-        return self.root.get_by_attrs(search_elements)
+        role = next((element for element in search_elements if element.name == "role"), None)
+        with self._lock.read():
+            nodes = self._get_nodes()
+            if role is None:
+                positions = range(len(nodes))
+            else:
+                # Only the nodes with a matching role are checked against the search elements
+                role_index = self._get_role_index()
+                if _is_pattern(role):
+                    pattern = re.compile(role.value)
+                    positions = sorted(
+                        position for key, keyed in role_index.items() if pattern.match(key) for position in keyed
+                    )
+                else:
+                    positions = role_index.get(role.value, [])
+            for search_element in sorted(search_elements, key=_is_pattern):
+                if not positions:
+                    break
+                column = self._get_column(search_element.name)
+                check = _compile_search_element(search_element)
+                # Without a role all the nodes are candidates, and the whole column is filtered without copying
+                values = column if isinstance(positions, range) else [column[position] for position in positions]
+                # Many nodes share the same values, so check each distinct value of the remaining nodes only once
+                matching = {value for value in set(values) if check(value)}
+                positions = list(compress(positions, map(matching.__contains__, values)))
+            return [nodes[position] for position in positions]
@@ -1,10 +1,11 @@
 import re
 import sys
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from JABWrapper.context_tree import ContextTree, SearchElement
 from JABWrapper.jab_types import (
     AccessibleContextInfo,
+    AccessibleContextSnapshot,
     AccessibleIcons,
     AccessibleKeyBindings,
     AccessibleTableInfo,
@@ -16,11 +17,20 @@ MATCH_OPTION = re.compile(
     r"^[\|\s]*?role:(.*?); name:(.*?); virtual_accessible_name:(.*?); description:?(.*?); ancestry:(\d+)*"
 )
 
+# The fixed separators of the fields in the same order as in the patterns above
+MATCH_SEPARATORS = (", Name=", ", VAN=", ", Desc")
+MATCH_OPTION_SEPARATORS = ("; name:", "; virtual_accessible_name:", "; description", "; ancestry:")
+
 IntegerLocatorTypes = ["x", "y", "width", "height", "indexInParent", "childrentCount"]
 
 
 class Row:
+    __slots__ = ("ancestry", "role", "name", "van", "desc")
+
     def __init__(self, line: str):
+        # The patterns are only needed for the lines that the plain string search can't split
+        if self._parse_fields(line):
+            return
         match = re.search(MATCH, line)
         if match:
             groups = match.groups()
@@ -38,54 +48,99 @@ class Row:
             self.desc = groups[3]
             self.ancestry = int(groups[4])
 
+    def _parse_fields(self, line: str) -> bool:
+        stripped = line.lstrip()
+        if stripped.startswith("Role="):
+            fields = _split_fields(stripped, len("Role="), MATCH_SEPARATORS)
+            if fields is None:
+                return False
+            indent = len(line) - len(stripped)
+            self.ancestry = int(indent / 2)
+            self.role = fields[0][1:-1]  # strip first first and last char
+            self.name = fields[1][1:-1]  # strip first first and last char
+            self.van = fields[2][1:-1]  # strip first first and last char
+            # The description is never captured by the pattern either
+            self.desc = ""
+            return True
+        stripped = stripped.lstrip("| ")
+        if stripped.startswith("role:"):
+            fields = _split_fields(stripped, len("role:"), MATCH_OPTION_SEPARATORS)
+            if fields is None:
+                return False
+            # The repr lines go on with the state and location fields after the ancestry
+            ancestry = fields[4].partition(";")[0].rstrip()
+            if not ancestry.isdecimal():
+                return False
+            self.role = fields[0]
+            self.name = fields[1]
+            self.van = fields[2]
+            self.desc = fields[3][1:] if fields[3].startswith(":") else fields[3]
+            self.ancestry = int(ancestry)
+            return True
+        return False
+
     def __str__(self):
         return f"{self.ancestry} role='{self.role}' name='{self.name}' van='{self.van}' desc='{self.desc}'"
 
 
+def _split_fields(text: str, start: int, separators: Tuple[str, ...]) -> Optional[List[str]]:
+    fields = []
+    for separator in separators:
+        end = text.find(separator, start)
+        if end == -1:
+            return None
+        fields.append(text[start:end])
+        start = end + len(separator)
+    fields.append(text[start:])
+    return fields
+
+
 class Node:
+    __slots__ = ("info", "parent", "children")
+
     def __init__(self, row):
         self.info = row
         self.parent = None
         self.children = []
 
-    def find_grandparent(self, ancestry):
-        if self.info.ancestry == ancestry:
-            return self
-        if self.parent:
-            return self.parent.find_grandparent(ancestry)
+    @property
+    def value(self) -> int:
+        # The fake context handle value
+        return id(self)
 
     def __str__(self):
-        string = str(self.info)
-        for child in self.children:
-            string += f"\n{child}"
-        return string
+        lines = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            lines.append(str(node.info))
+            stack.extend(reversed(node.children))
+        return "\n".join(lines)
 
 
 class Tree:
     def __init__(self, rows):
         self._rows = rows
         self.root = None
-        self._current_node = None
         self._parse()
 
     def _parse(self):
+        # The latest node of each ancestry level, the parent of a row is the one a level above it
+        open_nodes: List[Node] = []
         for row in self._rows:
             if row.ancestry == 0:
-                self.root = self._current_node = Node(row)
-            # childs child
-            if self._current_node.info.ancestry < (row.ancestry - 1):
-                self._current_node = self._current_node.children[-1]
-            # not child of this node
-            if self._current_node.info.ancestry > row.ancestry or self._current_node.info.ancestry == row.ancestry:
-                parent = self._current_node.find_grandparent(row.ancestry - 1)
-                if parent:
-                    self._current_node = parent
-            # next child
-            if self._current_node.info.ancestry == (row.ancestry - 1):
-                child = Node(row)
-                self._current_node.children.append(child)
-                child.parent = self._current_node
-                self._current_node = child
+                self.root = Node(row)
+                open_nodes = [self.root]
+                continue
+            # A row without a parent level above it doesn't fit in the tree
+            if row.ancestry > len(open_nodes):
+                continue
+            del open_nodes[row.ancestry :]
+            parent = open_nodes[-1]
+            child = Node(row)
+            parent.children.append(child)
+            child.parent = parent
+            open_nodes.append(child)
 
     def __str__(self):
         return str(self.root)
@@ -126,9 +181,19 @@ class FakeJabWrapper:
             False,
         )
 
+    def get_context_snapshot(self, context) -> AccessibleContextSnapshot:
+        return AccessibleContextSnapshot(
+            self.get_context_info(context),
+            self.get_virtual_accessible_name(context),
+            self.get_visible_children_count(context),
+        )
+
     def get_virtual_accessible_name(self, context):
         return context.info.van
 
+    def is_same_object(self, first, second) -> bool:
+        return first is second
+
     def get_visible_children_count(self, context):
         return len(context.children)
 
@@ -144,6 +209,9 @@ class FakeJabWrapper:
     def get_child_context(self, context, index):
         return context.children[index]
 
+    def get_child_contexts(self, context, start_index, count):
+        return context.children[start_index : start_index + count]
+
     def get_accessible_table_info(self, context):
         return AccessibleTableInfo(0, 0, 0, 0, 0, 0)
 
@@ -158,8 +226,17 @@ class LocatorSimulator:
     def __init__(self, locator_filename: str = "", locator: str = ""):
         self._locator_filename = locator_filename
         self.faker = None
+        # The same locators are usually searched over and over, the search elements are only read
+        self._locator_cache: Dict[Tuple[str, bool], List[List[SearchElement]]] = {}
+
+    def _parse_locator(self, locator, strict_default=False) -> List[List[SearchElement]]:
+        key = (locator, strict_default)
+        searches = self._locator_cache.get(key)
+        if searches is None:
+            searches = self._locator_cache[key] = self._parse_locator_levels(locator, strict_default)
+        return searches
 
-    def _parse_locator(self, locator, strict_default=False) -> List[SearchElement]:
+    def _parse_locator_levels(self, locator, strict_default) -> List[List[SearchElement]]:
         levels = locator.split(">")
         levels = [lvl.strip() for lvl in levels]
         searches = []
@@ -183,7 +260,7 @@ class LocatorSimulator:
             searches.append(lvl_search)
         return searches
 
-    def _find_elements(self, locator: str, index: int = None, strict: bool = False):
+    def _find_elements(self, locator: str, index: Optional[int] = None, strict: bool = False):
         searches = self._parse_locator(locator, strict)
         elements = []
         for lvl, search_elements in enumerate(searches):
@@ -195,11 +272,13 @@ class LocatorSimulator:
                     matches = elem.get_by_attrs(search_elements)
                     sub_matches.extend(matches)
                 elements = sub_matches
-        if index and len(elements) > (index + 1):
+        if index is None:
+            return elements
+        if index >= len(elements):
             raise AttributeError(
                 "Locator '%s' returned only %s elements (can't index element at %s)" % (locator, len(elements), index)
             )
-        return elements[index] if index else elements
+        return elements[index]
 
     def parse_element_tree(self, locator_filename=""):
         if not locator_filename and not self._locator_filename:
@@ -19,6 +19,16 @@ MAX_ICON_INFO = 10
 
 MAX_VISIBLE_CHILDREN_COUNT = 256
 
+# Interface flags of the AccessibleContextInfo accessibleValue field. The Access Bridge replaced the old value
+# support boolean with this bitfield of the implemented Java Accessibility interfaces.
+ACCESSIBLE_VALUE_INTERFACE = 1
+ACCESSIBLE_ACTION_INTERFACE = 2
+ACCESSIBLE_COMPONENT_INTERFACE = 4
+ACCESSIBLE_SELECTION_INTERFACE = 8
+ACCESSIBLE_TABLE_INTERFACE = 16
+ACCESSIBLE_TEXT_INTERFACE = 32
+ACCESSIBLE_HYPERTEXT_INTERFACE = 64
+
 
 class JavaObject(c_int64):
     pass
@@ -108,7 +118,8 @@ class AccessibleActions(Structure):
 
 
 class AccessibleActionsToDo(Structure):
-    _fields_ = [("actionsCount", c_int), ("actions", AccessibleActionInfo * MAX_ACTION_INFO)]
+    # The Access Bridge reads at most MAX_ACTIONS_TO_DO actions, and the structure is copied on every call
+    _fields_ = [("actionsCount", c_int), ("actions", AccessibleActionInfo * MAX_ACTIONS_TO_DO)]
 
 
 class AccessibleRelationInfo(Structure):
@@ -120,7 +131,7 @@ class AccessibleRelationInfo(Structure):
 
 
 class AccessibleRelationSetInfo(Structure):
-    _fields = [("relationCount", c_int), ("AccessibleRelationInfo", AccessibleRelationInfo * MAX_RELATIONS)]
+    _fields_ = [("relationCount", c_int), ("AccessibleRelationInfo", AccessibleRelationInfo * MAX_RELATIONS)]
 
 
 class AccessibleHyperlinkInfo(Structure):
@@ -181,3 +192,22 @@ class AccessibleTableCellInfo(Structure):
 
 class VisibleChildrenInfo(Structure):
     _fields_ = [("returnedChildrenCount", c_int), ("children", JavaObject * MAX_VISIBLE_CHILDREN_COUNT)]
+
+
+class AccessibleContextSnapshot(Structure):
+    """
+    Not part of the Access Bridge API. Groups the per element structures and values that are read
+    when parsing a node, so they can be filled with a single allocation.
+    """
+
+    _fields_ = [
+        ("contextInfo", AccessibleContextInfo),
+        ("virtualAccessibleName", c_wchar * MAX_STRING_SIZE),
+        ("visibleChildrenCount", c_int),
+        ("textInfo", AccessibleTextInfo),
+        ("textItems", AccessibleTextItemsInfo),
+        ("textSelection", AccessibleTextSelectionInfo),
+        ("textAttributes", AccessibleTextAttributesInfo),
+        ("textRect", AccessibleTextRectInfo),
+        ("keyBindings", AccessibleKeyBindings),
+    ]
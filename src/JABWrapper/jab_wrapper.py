@@ -2,10 +2,12 @@ import logging
 import os
 import re
 import sys
+import threading
 from ctypes import (
     CFUNCTYPE,
     POINTER,
     WINFUNCTYPE,
+    Array,
     WinError,
     byref,
     c_int,
@@ -16,11 +18,12 @@ from ctypes import (
     c_wchar_p,
     cdll,
     create_unicode_buffer,
+    sizeof,
     windll,
     wintypes,
 )
 from dataclasses import dataclass
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import win32process
 
@@ -31,6 +34,7 @@ from JABWrapper.jab_types import (
     AccessibleActions,
     AccessibleActionsToDo,
     AccessibleContextInfo,
+    AccessibleContextSnapshot,
     AccessibleHyperlinkInfo,
     AccessibleHypertextInfo,
     AccessibleIcons,
@@ -101,12 +105,95 @@ PopupMenuCanceledFP = CFUNCTYPE(None, c_long, JavaObject, JavaObject)
 PopupMenuWillBecomeInvisibleFP = CFUNCTYPE(None, c_long, JavaObject, JavaObject)
 PopupMenuWillBecomeVisibleFP = CFUNCTYPE(None, c_long, JavaObject, JavaObject)
 
+# The Access Bridge function pointer setter, the function type and the dispatching wrapper method by the callback name
+_EVENTS = {
+    # Property events
+    "property_change": ("setPropertyChangeFP", PropertyChangeFP, "_property_change"),
+    "property_name_change": ("setPropertyNameChangeFP", PropertyNameChangeFP, "_property_name_change"),
+    "property_description_change": (
+        "setPropertyDescriptionChangeFP",
+        PropertyDescriptionChangeFP,
+        "_property_description_change",
+    ),
+    "property_state_change": ("setPropertyStateChangeFP", PropertStateChangeFP, "_property_state_change"),
+    "property_value_change": ("setPropertyValueChangeFP", PropertyValueChangeFP, "_property_value_change"),
+    "property_selection_change": (
+        "setPropertySelectionChangeFP",
+        PropertySelectionChangeFP,
+        "_property_selection_change",
+    ),
+    "property_text_change": ("setPropertyTextChangeFP", PropertyTextChangedFP, "_property_text_change"),
+    "property_caret_change": ("setPropertyCaretChangeFP", PropertyCaretChangeFP, "_property_caret_change"),
+    "property_visible_data_change": (
+        "setPropertyVisibleDataChangeFP",
+        PropertyVisibleDataChangeFP,
+        "_property_visible_data_change",
+    ),
+    "property_child_change": ("setPropertyChildChangeFP", PropertyChildChangeFP, "_property_child_change"),
+    "property_active_descendent_change": (
+        "setPropertyActiveDescendentChangeFP",
+        PropertyActiveDescendentChangeFP,
+        "_property_active_descendent_change",
+    ),
+    "property_table_model_change": (
+        "setPropertyTableModelChangeFP",
+        PropertyTableModelChangeFP,
+        "_property_table_model_change",
+    ),
+    # Menu events
+    "menu_selected": ("setMenuSelectedFP", MenuSelectedFP, "_menu_selected"),
+    "menu_deselected": ("setMenuDeselectedFP", MenuDeselectedFP, "_menu_deselected"),
+    "menu_canceled": ("setMenuCanceledFP", MenuCanceledFP, "_menu_canceled"),
+    # Focus events
+    "focus_gained": ("setFocusGainedFP", FocusGainedFP, "_focus_gained"),
+    "focus_lost": ("setFocusLostFP", FocusLostFP, "_focus_lost"),
+    # Caret update events
+    "caret_update": ("setCaretUpdateFP", CaretUpdateFP, "_caret_update"),
+    # Mouse events
+    "mouse_clicked": ("setMouseClickedFP", MouseClickedFP, "_mouse_clicked"),
+    "mouse_entered": ("setMouseEnteredFP", MouseEnteredFP, "_mouse_entered"),
+    "mouse_exited": ("setMouseExitedFP", MouseExitedFP, "_mouse_exited"),
+    "mouse_pressed": ("setMousePressedFP", MousePressedFP, "_mouse_pressed"),
+    "mouse_released": ("setMouseReleasedFP", MouseReleasedFP, "_mouse_released"),
+    # Popup menu events
+    "popup_menu_canceled": ("setPopupMenuCanceledFP", PopupMenuCanceledFP, "_popup_menu_canceled"),
+    "popup_menu_will_become_invisible": (
+        "setPopupMenuWillBecomeInvisibleFP",
+        PopupMenuWillBecomeInvisibleFP,
+        "_popup_menu_will_become_invisible",
+    ),
+    "popup_menu_will_become_visible": (
+        "setPopupMenuWillBecomeVisibleFP",
+        PopupMenuWillBecomeVisibleFP,
+        "_popup_menu_will_become_visible",
+    ),
+}
+
 
 class APIException(Exception):
     def __init__(self, *args: object) -> None:
         super().__init__(*args)
 
 
+# Per thread string buffers of the fixed size calls that only return the string, as the tree can be built on
+# several threads
+_string_buffers = threading.local()
+
+
+def _string_buffer(size: int) -> Array:
+    """
+    Get an empty string buffer of the given size that is reused by the next calls of the same thread.
+    """
+    buffers = _string_buffers.__dict__
+    buf = buffers.get(size)
+    if buf is None:
+        buf = buffers[size] = create_unicode_buffer(size)
+    else:
+        # Start from an empty string instead of the one of the previous call
+        buf[0] = "\0"
+    return buf
+
+
 @dataclass
 class JavaWindow:
     pid: int
@@ -152,7 +239,7 @@ class Enumerator:
         if isJava:
             _, found_pid = win32process.GetWindowThreadProcessId(hwnd)
             java_window = JavaWindow(found_pid, hwnd, title)
-            logging.debug(f"found window title={java_window.title} pid={java_window.pid} hwnd={java_window.hwnd}")
+            logging.debug("found window title=%s pid=%s hwnd=%s", java_window.title, java_window.pid, java_window.hwnd)
             self._windows.append(java_window)
 
         return True
@@ -469,124 +556,25 @@ class JavaAccessBridgeWrapper:
         self._wab.setPopupMenuWillBecomeVisibleFP.restype = None
 
     def _set_callbacks(self) -> None:
-        # Property events
-        self._wab.setPropertyChangeFP(
-            self._get_callback_func("setPropertyChangeFP", PropertyChangeFP, self._property_change)
-        )
-        self._wab.setPropertyNameChangeFP(
-            self._get_callback_func("setPropertyNameChangeFP", PropertyNameChangeFP, self._property_name_change)
-        )
-        self._wab.setPropertyDescriptionChangeFP(
-            self._get_callback_func(
-                "setPropertyDescriptionChangeFP", PropertyDescriptionChangeFP, self._property_description_change
-            )
-        )
-        self._wab.setPropertyStateChangeFP(
-            self._get_callback_func("setPropertyStateChangeFP", PropertStateChangeFP, self._property_state_change)
-        )
-        self._wab.setPropertyValueChangeFP(
-            self._get_callback_func("setPropertyValueChangeFP", PropertyValueChangeFP, self._property_value_change)
-        )
-        self._wab.setPropertySelectionChangeFP(
-            self._get_callback_func(
-                "setPropertySelectionChangeFP", PropertySelectionChangeFP, self._property_selection_change
-            )
-        )
-        self._wab.setPropertyTextChangeFP(
-            self._get_callback_func("setPropertyTextChangeFP", PropertyTextChangedFP, self._property_text_change)
-        )
-        self._wab.setPropertyCaretChangeFP(
-            self._get_callback_func("setPropertyCaretChangeFP", PropertyCaretChangeFP, self._property_caret_change)
-        )
-        self._wab.setPropertyVisibleDataChangeFP(
-            self._get_callback_func(
-                "setPropertyVisibleDataChangeFP", PropertyVisibleDataChangeFP, self._property_visible_data_change
-            )
-        )
-        self._wab.setPropertyChildChangeFP(
-            self._get_callback_func("setPropertyChildChangeFP", PropertyChildChangeFP, self._property_child_change)
-        )
-        self._wab.setPropertyActiveDescendentChangeFP(
-            self._get_callback_func(
-                "setPropertyActiveDescendentChangeFP",
-                PropertyActiveDescendentChangeFP,
-                self._property_active_descendent_change,
-            )
-        )
-        self._wab.setPropertyTableModelChangeFP(
-            self._get_callback_func(
-                "setPropertyTableModelChangeFP", PropertyTableModelChangeFP, self._property_table_model_change
-            )
-        )
-        # Menu events
-        self._wab.setMenuSelectedFP(self._get_callback_func("setMenuSelectedFP", MenuSelectedFP, self._menu_selected))
-        self._wab.setMenuDeselectedFP(
-            self._get_callback_func("setMenuDeselectedFP", MenuDeselectedFP, self._menu_deselected)
-        )
-        self._wab.setMenuCanceledFP(self._get_callback_func("setMenuCanceledFP", MenuCanceledFP, self._menu_canceled))
-        # Focus events
-        self._wab.setFocusGainedFP(self._get_callback_func("setFocusGainedFP", FocusGainedFP, self._focus_gained))
-        self._wab.setFocusLostFP(self._get_callback_func("setFocusLostFP", FocusLostFP, self._focus_lost))
-        # Caret update events
-        self._wab.setCaretUpdateFP(self._get_callback_func("setCaretUpdateFP", CaretUpdateFP, self._caret_update))
-        # Mouse events
-        self._wab.setMouseClickedFP(self._get_callback_func("setMouseClickedFP", MouseClickedFP, self._mouse_clicked))
-        self._wab.setMouseEnteredFP(self._get_callback_func("SetMouseEnteredFP", MouseEnteredFP, self._mouse_entered))
-        self._wab.setMouseExitedFP(self._get_callback_func("setMouseExitedFP", MouseExitedFP, self._mouse_exited))
-        self._wab.setMousePressedFP(self._get_callback_func("setMousePressedFP", MousePressedFP, self._mouse_pressed))
-        self._wab.setMouseReleasedFP(
-            self._get_callback_func("setMouseReleasedFP", MouseReleasedFP, self._mouse_released)
-        )
-        # Popup menu events
-        self._wab.setPopupMenuCanceledFP(
-            self._get_callback_func("setPopupMenuCanceledFP", PopupMenuCanceledFP, self._popup_menu_canceled)
-        )
-        self._wab.setPopupMenuWillBecomeInvisibleFP(
-            self._get_callback_func(
-                "setPopupMenuWillBecomeInvisibleFP",
-                PopupMenuWillBecomeInvisibleFP,
-                self._popup_menu_will_become_invisible,
-            )
-        )
-        self._wab.setPopupMenuWillBecomeVisibleFP(
-            self._get_callback_func(
-                "setPopupMenuWillBecomeVisibleFP", PopupMenuWillBecomeVisibleFP, self._popup_menu_will_become_visible
-            )
-        )
+        # The events are enabled one by one when their first callback is registered, so that the Access Bridge
+        # doesn't send the events that nobody handles at all
+        for name in self._context_callbacks:
+            self._enable_event(name)
+
+    def _enable_event(self, name: str) -> None:
+        if name not in _EVENTS:
+            logging.warning("Unknown callback=%s", name)
+            return
+        setter, function_type, handler = _EVENTS[name]
+        getattr(self._wab, setter)(self._get_callback_func(setter, function_type, getattr(self, handler)))
+
+    def _disable_event(self, name: str) -> None:
+        if name in _EVENTS:
+            getattr(self._wab, _EVENTS[name][0])(None)
 
     def _remove_callbacks(self) -> None:
-        # Property events
-        self._wab.setPropertyChangeFP(None)
-        self._wab.setPropertyNameChangeFP(None)
-        self._wab.setPropertyDescriptionChangeFP(None)
-        self._wab.setPropertyStateChangeFP(None)
-        self._wab.setPropertyValueChangeFP(None)
-        self._wab.setPropertySelectionChangeFP(None)
-        self._wab.setPropertyTextChangeFP(None)
-        self._wab.setPropertyCaretChangeFP(None)
-        self._wab.setPropertyVisibleDataChangeFP(None)
-        self._wab.setPropertyChildChangeFP(None)
-        self._wab.setPropertyActiveDescendentChangeFP(None)
-        self._wab.setPropertyTableModelChangeFP(None)
-        # Menu events
-        self._wab.setMenuSelectedFP(None)
-        self._wab.setMenuDeselectedFP(None)
-        self._wab.setMenuCanceledFP(None)
-        # Focus events
-        self._wab.setFocusGainedFP(None)
-        self._wab.setFocusLostFP(None)
-        # Caret update events
-        self._wab.setCaretUpdateFP(None)
-        # Mouse events
-        self._wab.setMouseClickedFP(None)
-        self._wab.setMouseEnteredFP(None)
-        self._wab.setMouseExitedFP(None)
-        self._wab.setMousePressedFP(None)
-        self._wab.setMouseReleasedFP(None)
-        # Popup menu events
-        self._wab.setPopupMenuCanceledFP(None)
-        self._wab.setPopupMenuWillBecomeInvisibleFP(None)
-        self._wab.setPopupMenuWillBecomeVisibleFP(None)
+        for setter, _, _ in _EVENTS.values():
+            getattr(self._wab, setter)(None)
 
     def set_hwnd(self, hwnd: wintypes.HWND) -> None:
         self._hwnd = hwnd
@@ -611,7 +599,7 @@ class JavaAccessBridgeWrapper:
             context: JavaObject context.
         """
         if self._vmID and self.context:
-            logging.debug(f"Releasing object={context}")
+            logging.debug("Releasing object=%s", context)
             self._wab.releaseJavaObject(self._vmID, c_long(context.value).value)
 
     def switch_window_by_title(self, title: str) -> int:
@@ -627,7 +615,7 @@ class JavaAccessBridgeWrapper:
         Raises:
             Exception: Window not found.
         """
-        self._context_callbacks.clear()
+        self.clear_callbacks()
         self._hwnd: wintypes.HWND = None
         self._vmID = c_long()
         self.context = JavaObject()
@@ -639,7 +627,7 @@ class JavaAccessBridgeWrapper:
             raise WinError()
 
         java_window = enumerator.find_by_title(title)
-        logging.debug(f"found matching window={title}")
+        logging.debug("found matching window=%s", title)
         self._hwnd = java_window.hwnd
         self._vmID = c_long()
         self.context = JavaObject()
@@ -672,7 +660,7 @@ class JavaAccessBridgeWrapper:
         Raises:
             Exception: Window not found.
         """
-        self._context_callbacks.clear()
+        self.clear_callbacks()
         self._hwnd: wintypes.HWND = None
         self._vmID = c_long()
         self.context = JavaObject()
@@ -683,7 +671,7 @@ class JavaAccessBridgeWrapper:
             raise WinError()
 
         java_window = enumerator.find_by_pid(pid)
-        logging.debug(f"found matching window={pid}")
+        logging.debug("found matching window=%s", pid)
         self._hwnd = java_window.hwnd
         self._vmID = c_long()
         self.context = JavaObject()
@@ -768,6 +756,29 @@ class JavaAccessBridgeWrapper:
     def get_child_context(self, context: JavaObject, index: int) -> JavaObject:
         return self._wab.getAccessibleChildFromContext(self._vmID, context, index)
 
+    def get_child_contexts(self, context: JavaObject, start_index: int, count: int) -> Array:
+        """
+        Get the context handles for a range of children of the element.
+
+        The Windows Access Bridge doesn't expose a bulk children API, so the handles are collected
+        into a single pre-allocated array within one wrapper call instead of one call per child.
+
+        Args:
+            context: the element context handle.
+            start_index: index of the first child.
+            count: number of children to fetch.
+
+        Returns:
+            Array of JavaObject child context handles.
+        """
+        count = max(count, 0)
+        children = (JavaObject * count)()
+        get_child = self._wab.getAccessibleChildFromContext
+        vm_id = self._vmID
+        for index in range(count):
+            children[index] = get_child(vm_id, context, start_index + index)
+        return children
+
     def get_accessible_parent_from_context(self, context) -> JavaObject:
         """
         Get the element parent context.
@@ -1043,7 +1054,7 @@ class JavaAccessBridgeWrapper:
         relation_set_info = AccessibleRelationSetInfo()
         logging.info("getting rel set")
         ok = self._wab.getAccessibleRelationSet(self._vmID, context, byref(relation_set_info))
-        logging.info(f"rel set={ok}")
+        logging.info("rel set=%s", ok)
         if not ok:
             raise APIException("Failed to get accessible relation set info")
         return relation_set_info
@@ -1087,6 +1098,72 @@ class JavaAccessBridgeWrapper:
             raise APIException("Failed to get accessible context info")
         return info
 
+    def get_context_snapshot(self, context: JavaObject) -> AccessibleContextSnapshot:
+        """
+        Get element context information together with its virtual accessible name, visible children count,
+        text and key bindings information.
+
+        The visible children are only counted when the element has children, and the text information is
+        only queried when the element implements the accessible text interface.
+
+        Args:
+            context: the element context handle.
+
+        Returns:
+            The AccessibleContextSnapshot object. For example:
+
+            {
+                "contextInfo": AccessibleContextInfo,
+                "virtualAccessibleName": "Button",
+                "visibleChildrenCount": 0,
+                "textInfo": AccessibleTextInfo,
+                "textItems": AccessibleTextItemsInfo,
+                "textSelection": AccessibleTextSelectionInfo,
+                "textAttributes": AccessibleTextAttributesInfo,
+                "textRect": AccessibleTextRectInfo,
+                "keyBindings": AccessibleKeyBindings
+            }
+
+        Raises:
+            APIException: failed to call the java access bridge API with attributes.
+        """
+        snapshot = AccessibleContextSnapshot()
+        info = snapshot.contextInfo
+        if not self._wab.getAccessibleContextInfo(self._vmID, context, byref(info)):
+            raise APIException("Failed to get accessible context info")
+        # The Access Bridge resolves the virtual accessible name from the accessible name or description first,
+        # so only the elements without either need the call that searches the labels and children for it
+        name = info.name or info.description
+        if name:
+            snapshot.virtualAccessibleName = name
+        else:
+            # The name is read straight into the snapshot instead of a separate buffer
+            van = (c_wchar * MAX_STRING_SIZE).from_buffer(
+                snapshot, AccessibleContextSnapshot.virtualAccessibleName.offset
+            )
+            if not self._wab.getVirtualAccessibleName(self._vmID, context, van, MAX_STRING_SIZE):
+                raise APIException("Failed to get virtual accessible name")
+        if info.childrenCount:
+            snapshot.visibleChildrenCount = self._wab.getVisibleChildrenCount(self._vmID, context)
+        if info.accessibleText:
+            self._fill_text_snapshot(context, snapshot)
+        if not self._wab.getAccessibleKeyBindings(self._vmID, context, byref(snapshot.keyBindings)):
+            raise APIException("Failed to get accessible key bindings")
+        return snapshot
+
+    def _fill_text_snapshot(self, context: JavaObject, snapshot: AccessibleContextSnapshot) -> None:
+        info = snapshot.contextInfo
+        if not self._wab.getAccessibleTextInfo(self._vmID, context, byref(snapshot.textInfo), info.x, info.y):
+            raise APIException("Failed to get accessible text info")
+        if not self._wab.getAccessibleTextItems(self._vmID, context, byref(snapshot.textItems), 0):
+            raise APIException("Failed to get accessible text context")
+        if not self._wab.getAccessibleTextSelectionInfo(self._vmID, context, byref(snapshot.textSelection)):
+            raise APIException("Failed to get accessible text selection info")
+        if not self._wab.getAccessibleTextAttributes(self._vmID, context, 0, byref(snapshot.textAttributes)):
+            raise APIException("Failed to get accessible text attributes info")
+        if not self._wab.getAccessibleTextRect(self._vmID, context, byref(snapshot.textRect), 0):
+            raise APIException("Failed to get accessible text rect info")
+
     def get_version_info(self) -> AccessBridgeVersionInfo:
         """
         Get window version information.
@@ -1453,7 +1530,7 @@ class JavaAccessBridgeWrapper:
         Raises:
             APIException: failed to call the java access bridge API with attributes.
         """
-        buf = create_unicode_buffer(SHORT_STRING_SIZE)
+        buf = _string_buffer(SHORT_STRING_SIZE)
         ok = self._wab.getCurrentAccessibleValueFromContext(self._vmID, context, buf, SHORT_STRING_SIZE)
         if not ok:
             raise APIException("Failed to get current accessible value from context")
@@ -1472,7 +1549,7 @@ class JavaAccessBridgeWrapper:
         Raises:
             APIException: failed to call the java access bridge API with attributes.
         """
-        buf = create_unicode_buffer(SHORT_STRING_SIZE)
+        buf = _string_buffer(SHORT_STRING_SIZE)
         ok = self._wab.getMaximumAccessibleValueFromContext(self._vmID, context, buf, SHORT_STRING_SIZE)
         if not ok:
             raise APIException("Failed to get maximum accessible value from context")
@@ -1491,12 +1568,38 @@ class JavaAccessBridgeWrapper:
         Raises:
             APIException: failed to call the java access bridge API with attributes.
         """
-        buf = create_unicode_buffer(SHORT_STRING_SIZE)
+        buf = _string_buffer(SHORT_STRING_SIZE)
         ok = self._wab.getMinimumAccessibleValueFromContext(self._vmID, context, buf, SHORT_STRING_SIZE)
         if not ok:
             raise APIException("Failed to get minimum accessible value from context")
         return buf.value
 
+    def get_accessible_values_from_context(self, context: JavaObject) -> Tuple[str, str, str]:
+        """
+        Get the current, minimum and maximum values of element, read into a single buffer.
+
+        Args:
+            context: the element context handle.
+
+        Returns:
+            Tuple[str, str, str]: the current, minimum and maximum values.
+
+        Raises:
+            APIException: failed to call the java access bridge API with attributes.
+        """
+        buf = _string_buffer(3 * SHORT_STRING_SIZE)
+        current, minimum, maximum = (
+            (c_wchar * SHORT_STRING_SIZE).from_buffer(buf, index * sizeof(c_wchar) * SHORT_STRING_SIZE)
+            for index in range(3)
+        )
+        if not self._wab.getCurrentAccessibleValueFromContext(self._vmID, context, current, SHORT_STRING_SIZE):
+            raise APIException("Failed to get current accessible value from context")
+        if not self._wab.getMinimumAccessibleValueFromContext(self._vmID, context, minimum, SHORT_STRING_SIZE):
+            raise APIException("Failed to get minimum accessible value from context")
+        if not self._wab.getMaximumAccessibleValueFromContext(self._vmID, context, maximum, SHORT_STRING_SIZE):
+            raise APIException("Failed to get maximum accessible value from context")
+        return current.value, minimum.value, maximum.value
+
     def add_accessible_selection_from_context(self, context: JavaObject, index: int) -> None:
         """
         Select value in selectable context.
@@ -1752,7 +1855,7 @@ class JavaAccessBridgeWrapper:
         Raises:
             APIException: failed to call the java access bridge API with attributes.
         """
-        buf = create_unicode_buffer(MAX_STRING_SIZE)
+        buf = _string_buffer(MAX_STRING_SIZE)
         ok = self._wab.getVirtualAccessibleName(self._vmID, context, buf, MAX_STRING_SIZE)
         if not ok:
             raise APIException("Failed to get virtual accessible name")
@@ -1772,6 +1875,11 @@ class JavaAccessBridgeWrapper:
         """
         Register a callback handler for GUI events.
 
+        The first callback of an event enables the event in the Access Bridge and `clear_callbacks` disables
+        it again. That is done on the calling thread instead of the message pump thread that created the
+        wrapper, so the message pump has to keep running while the callbacks are registered or cleared from
+        another thread, for example when the context tree is created.
+
         Args:
             name: the of the callback.
             callback: callback function.
@@ -1795,7 +1903,7 @@ class JavaAccessBridgeWrapper:
 
             * menu_selected
             * menu_deselected
-            * menu_calceled
+            * menu_canceled
 
             * focus_gained
             * focus_lost
@@ -1812,10 +1920,33 @@ class JavaAccessBridgeWrapper:
             * popup_menu_will_become_invisible
             * popup_menu_will_become_visible
         """
-        logging.debug(f"Registering callback={name}")
-        self._context_callbacks.setdefault(name, []).append(callback)
+        self.register_callbacks({name: callback})
+
+    def register_callbacks(self, callbacks: Dict[str, Callable[[JavaObject], None]]) -> None:
+        """
+        Register multiple callback handlers for GUI events at once. The events are enabled on the calling
+        thread, see `register_callback`.
+
+        Args:
+            callbacks: callback functions by the callback name. See `register_callback` for the possible names.
+
+        Returns:
+            None
+        """
+        logging.debug("Registering callbacks=%s", list(callbacks))
+        context_callbacks = self._context_callbacks
+        for name, callback in callbacks.items():
+            if name not in context_callbacks and not self.ignore_callbacks:
+                self._enable_event(name)
+            context_callbacks.setdefault(name, []).append(callback)
 
     def clear_callbacks(self):
+        """
+        Remove all the callback handlers and disable their events on the calling thread, see `register_callback`.
+        """
+        if not self.ignore_callbacks:
+            for name in self._context_callbacks:
+                self._disable_event(name)
         self._context_callbacks.clear()
 
     """
@@ -1881,9 +2012,9 @@ class JavaAccessBridgeWrapper:
                     cp(source)
 
     def _property_caret_change(self, vmID: c_long, event: JavaObject, source: JavaObject, old_pos: int, new_pos: int):
-        with ReleaseEvent(self, vmID, "set_property_caret_change", event, source):
-            if "set_property_caret_change" in self._context_callbacks:
-                for cp in self._context_callbacks["set_property_caret_change"]:
+        with ReleaseEvent(self, vmID, "property_caret_change", event, source):
+            if "property_caret_change" in self._context_callbacks:
+                for cp in self._context_callbacks["property_caret_change"]:
                     cp(source, old_pos, new_pos)
 
     def _property_visible_data_change(self, vmID: c_long, event: JavaObject, source: JavaObject):
@@ -1904,7 +2035,7 @@ class JavaAccessBridgeWrapper:
         self, vmID: c_long, event: JavaObject, source: JavaObject, old_child: JavaObject, new_child: JavaObject
     ):
         with ReleaseEvent(self, vmID, "property_active_descendent_change", event, source):
-            if "property active descendent change" in self._context_callbacks:
+            if "property_active_descendent_change" in self._context_callbacks:
                 for cp in self._context_callbacks["property_active_descendent_change"]:
                     cp(source, old_child, new_child)
 
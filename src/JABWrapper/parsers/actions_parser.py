@@ -1,43 +1,69 @@
-from typing import List
+import sys
+from functools import lru_cache
+from typing import List, Optional
 
 from JABWrapper.jab_types import (
+    AccessibleActionInfo,
     AccessibleActionsToDo,
     AccessibleContextInfo,
     JavaObject,
 )
 from JABWrapper.jab_wrapper import JavaAccessBridgeWrapper
-from JABWrapper.parsers.parser_if import Parser
 
 
-class AccessibleActionsParser(Parser):
+@lru_cache(maxsize=256)
+def _action_key(action: str) -> str:
+    # The scripts repeat the same few action names, so each is lowercased only once
+    return sys.intern(action.lower())
+
+
+class AccessibleActionsParser:
+    __slots__ = ("_aci", "_actions", "_click_action")
+
     def __init__(self, aci: AccessibleContextInfo) -> None:
+        self.reset(aci)
+
+    def reset(self, aci: AccessibleContextInfo) -> None:
         self._aci = aci
         self._actions = dict()
+        self._click_action: Optional[AccessibleActionInfo] = None
 
     def __str__(self) -> str:
         if not self._aci.accessibleAction:
             return ""
-        return " actions={}".format(", ".join([action for action in self._actions]))
+        return " actions={}".format(", ".join(self._actions))
 
     def parse(self, jab_wrapper: JavaAccessBridgeWrapper, context: JavaObject) -> None:
-        self._actions.clear()
         if self._aci.accessibleAction:
             actions = jab_wrapper.get_accessible_actions(context)
-            for index in range(actions.actionsCount):
-                actionInfo = actions.actionInfo[index]
-                self._actions[actionInfo.name.lower()] = actionInfo
+            # The action infos are copied out, as the views would keep the whole actions buffer alive
+            self._actions = {
+                sys.intern(action_info.name.lower()): AccessibleActionInfo.from_buffer_copy(action_info)
+                for action_info in actions.actionInfo[: actions.actionsCount]
+            }
+        else:
+            self._actions = {}
+        self._click_action = self._actions.get("click")
 
     def list_actions(self) -> List[str]:
         return list(self._actions)
 
     def do_action(self, jab_wrapper: JavaAccessBridgeWrapper, context: JavaObject, action: str) -> None:
-        if not action.lower() in self._actions:
+        key = _action_key(action)
+        if key not in self._actions:
             raise NotImplementedError("Does not implement the {} action".format(action))
-        actions = AccessibleActionsToDo(actionsCount=1, actions=(self._actions[action],))
-        jab_wrapper.do_accessible_actions(context, actions)
+        self._do_action_info(jab_wrapper, context, self._actions[key])
 
     def click(self, jab_wrapper: JavaAccessBridgeWrapper, context: JavaObject) -> None:
-        self.do_action(jab_wrapper, context, "click")
+        if self._click_action is None:
+            raise NotImplementedError("Does not implement the click action")
+        self._do_action_info(jab_wrapper, context, self._click_action)
+
+    def _do_action_info(
+        self, jab_wrapper: JavaAccessBridgeWrapper, context: JavaObject, action_info: AccessibleActionInfo
+    ) -> None:
+        actions = AccessibleActionsToDo(actionsCount=1, actions=(action_info,))
+        jab_wrapper.do_accessible_actions(context, actions)
 
     def insert_content(self, jab_wrapper: JavaAccessBridgeWrapper, context: JavaObject, text: str) -> None:
         jab_wrapper.set_text_contents(context, text)
@@ -1,36 +1,44 @@
+from typing import Optional
+
 from JABWrapper.jab_types import (
+    ACCESSIBLE_HYPERTEXT_INTERFACE,
     MAX_HYPERLINKS,
     AccessibleContextInfo,
     AccessibleHypertextInfo,
     JavaObject,
 )
 from JABWrapper.jab_wrapper import JavaAccessBridgeWrapper
-from JABWrapper.parsers.parser_if import Parser
 
 
-class AccessibleHypertextParser(Parser):
+class AccessibleHypertextParser:
+    __slots__ = ("_aci", "_info")
+
     def __init__(self, aci: AccessibleContextInfo) -> None:
+        self.reset(aci)
+
+    def reset(self, aci: AccessibleContextInfo) -> None:
         self._aci = aci
-        self._info = AccessibleHypertextInfo()
+        # The empty structure is only created when read, as most elements don't have hypertext
+        self._info: Optional[AccessibleHypertextInfo] = None
 
     def __str__(self) -> str:
-        if not self._aci.accessibleText or self._info.linkCount > MAX_HYPERLINKS or self._info.linkCount < 0:
+        if not self._aci.accessibleText:
             return ""
-        txt = f" links={self._info.linkCount}"
-        for i in range(self._info.linkCount):
-            txt += f", link={self._info.links[i].text}"
-        return txt
+        info = self.info
+        if info.linkCount > MAX_HYPERLINKS or info.linkCount < 0:
+            return ""
+        links = info.links
+        return f" links={info.linkCount}" + "".join(f", link={links[i].text}" for i in range(info.linkCount))
 
     def parse(self, jab_wrapper: JavaAccessBridgeWrapper, context: JavaObject) -> None:
         """
-        TODO: Identify which elements may contain hypertext.
-
         From java documentation (https://docs.oracle.com/javase/6/docs/api/javax/accessibility/AccessibleHypertext.html),
         the AccessibleText element may implement the AccessibleHypertext object, but not all AccessibleText elements do.
 
-        The element JEditorPane.JEditorPaneAccessibleHypertextSupport does implement it, but is identifiable from the AccessibleContextInfo?
+        The elements that do, like JEditorPane.JEditorPaneAccessibleHypertextSupport, are flagged in the interfaces
+        bitfield of the AccessibleContextInfo.
         """
-        if self._aci.accessibleText:
+        if self._aci.accessibleText and self._aci.accessibleValue & ACCESSIBLE_HYPERTEXT_INTERFACE:
             self._info = jab_wrapper.get_accessible_hypertext(context)
 
     @property
@@ -52,6 +60,8 @@ class AccessibleHypertextParser(Parser):
                 "accessibleHypertext", JavaObject
             }
         """
+        if self._info is None:
+            self._info = AccessibleHypertextInfo()
         return self._info
 
     @info.setter
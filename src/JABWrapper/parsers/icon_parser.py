@@ -1,20 +1,27 @@
+from typing import Optional
+
 from JABWrapper.jab_types import AccessibleContextInfo, AccessibleIcons, JavaObject
 from JABWrapper.jab_wrapper import JavaAccessBridgeWrapper
-from JABWrapper.parsers.parser_if import Parser
 
 
-class AccessibleIconParser(Parser):
+class AccessibleIconParser:
+    __slots__ = ("_aci", "_icons")
+
     def __init__(self, aci: AccessibleContextInfo) -> None:
+        self.reset(aci)
+
+    def reset(self, aci: AccessibleContextInfo) -> None:
         self._aci = aci
-        self._icons = AccessibleIcons()
+        # Replaced by every parse, so the empty structure is only created when read before parsing
+        self._icons: Optional[AccessibleIcons] = None
 
     def __str__(self) -> str:
-        string = f" icons={self._icons.iconsCount}"
-        if self._icons.iconsCount > 0:
-            for index in range(self._icons.iconsCount):
-                info = self._icons.iconInfo[index]
-                string += f" d={info.description} h={info.height} w={info.width}"
-        return string
+        icons = self.icons
+        icon_info = icons.iconInfo
+        return f" icons={icons.iconsCount}" + "".join(
+            f" d={info.description} h={info.height} w={info.width}"
+            for info in (icon_info[index] for index in range(icons.iconsCount))
+        )
 
     def parse(self, jab_wrapper: JavaAccessBridgeWrapper, context: JavaObject) -> None:
         self._icons = jab_wrapper.get_accessible_icons(context)
@@ -36,6 +43,8 @@ class AccessibleIconParser(Parser):
                 ]
             }
         """
+        if self._icons is None:
+            self._icons = AccessibleIcons()
         return self._icons
 
     @icons.setter
@@ -1,32 +1,40 @@
 from JABWrapper.jab_types import (
     AccessibleContextInfo,
+    AccessibleContextSnapshot,
     AccessibleKeyBindings,
     JavaObject,
 )
 from JABWrapper.jab_wrapper import JavaAccessBridgeWrapper
-from JABWrapper.parsers.parser_if import Parser
 
 
-class AccessibleKeyBindingsParser(Parser):
+class AccessibleKeyBindingsParser:
     """
     Attribute keybinds contains
     """
 
+    __slots__ = ("_aci", "_keybinds")
+
     def __init__(self, aci: AccessibleContextInfo) -> None:
+        self.reset(aci)
+
+    def reset(self, aci: AccessibleContextInfo) -> None:
         self._aci = aci
         self._keybinds = AccessibleKeyBindings()
 
     def __str__(self) -> str:
-        string = f" kbs={self.keybinds.keyBindingsCount}"
-        if self.keybinds.keyBindingsCount > 0:
-            for index in range(self.keybinds.keyBindingsCount):
-                info = self.keybinds.AccessibleKeyBindingInfo[index]
-                string += f" c={info.character} m={info.modifiers}"
-        return string
+        binding_info = self.keybinds.AccessibleKeyBindingInfo
+        return f" kbs={self.keybinds.keyBindingsCount}" + "".join(
+            f" c={info.character} m={info.modifiers}"
+            for info in (binding_info[index] for index in range(self.keybinds.keyBindingsCount))
+        )
 
     def parse(self, jab_wrapper: JavaAccessBridgeWrapper, context: JavaObject) -> None:
         self.keybinds = jab_wrapper.get_accessible_key_bindings(context)
 
+    def load(self, snapshot: AccessibleContextSnapshot) -> None:
+        # Copied out, as the view would keep the whole snapshot alive
+        self.keybinds = AccessibleKeyBindings.from_buffer_copy(snapshot.keyBindings)
+
     @property
     def keybinds(self) -> AccessibleKeyBindings:
         """
@@ -1,3 +1,16 @@
-class Parser:
-    def parse() -> None:
-        raise NotImplementedError()
+from typing import Protocol
+
+from JABWrapper.jab_types import AccessibleContextInfo, JavaObject
+from JABWrapper.jab_wrapper import JavaAccessBridgeWrapper
+
+
+class Parser(Protocol):
+    """
+    Interface of the element detail parsers. The parsers don't inherit it, they only need to implement it.
+    """
+
+    def reset(self, aci: AccessibleContextInfo) -> None:
+        ...
+
+    def parse(self, jab_wrapper: JavaAccessBridgeWrapper, context: JavaObject) -> None:
+        ...
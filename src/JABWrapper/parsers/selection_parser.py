@@ -1,10 +1,14 @@
 from JABWrapper.jab_types import AccessibleContextInfo, JavaObject
 from JABWrapper.jab_wrapper import JavaAccessBridgeWrapper
-from JABWrapper.parsers.parser_if import Parser
 
 
-class AccessibleSelectionParser(Parser):
+class AccessibleSelectionParser:
+    __slots__ = ("_aci", "selection_count")
+
     def __init__(self, aci: AccessibleContextInfo) -> None:
+        self.reset(aci)
+
+    def reset(self, aci: AccessibleContextInfo) -> None:
         self._aci = aci
         self.selection_count = 0
 
@@ -14,4 +18,5 @@ class AccessibleSelectionParser(Parser):
         return ""
 
     def parse(self, jab_wrapper: JavaAccessBridgeWrapper, context: JavaObject) -> None:
-        self.selection_count = jab_wrapper.get_accessible_selection_count_from_context(context)
+        if self._aci.accessibleSelection:
+            self.selection_count = jab_wrapper.get_accessible_selection_count_from_context(context)
@@ -1,20 +1,26 @@
 from JABWrapper.jab_types import AccessibleContextInfo, AccessibleTableInfo, JavaObject
 from JABWrapper.jab_wrapper import JavaAccessBridgeWrapper
-from JABWrapper.parsers.parser_if import Parser
 
 
-class AccessibleTableParser(Parser):
+class AccessibleTableParser:
+    __slots__ = ("_aci", "_is_table", "_table")
+
     def __init__(self, aci: AccessibleContextInfo) -> None:
+        self.reset(aci)
+
+    def reset(self, aci: AccessibleContextInfo) -> None:
         self._aci = aci
+        # Reading the role decodes the whole string field, so it is only read once per parse
+        self._is_table = aci.role == "table"
         self._table = AccessibleTableInfo()
 
     def __str__(self) -> str:
-        if self._aci.role == "table":
+        if self._is_table:
             return f" table={self._table.rowCount},{self._table.columnCount}"
         return ""
 
     def parse(self, jab_wrapper: JavaAccessBridgeWrapper, context: JavaObject) -> None:
-        if self._aci.role == "table":
+        if self._is_table:
             self._table = jab_wrapper.get_accessible_table_info(context)
 
     @property
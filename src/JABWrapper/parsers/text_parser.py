@@ -1,5 +1,8 @@
+from typing import Optional
+
 from JABWrapper.jab_types import (
     AccessibleContextInfo,
+    AccessibleContextSnapshot,
     AccessibleTextAttributesInfo,
     AccessibleTextInfo,
     AccessibleTextItemsInfo,
@@ -8,17 +11,22 @@ from JABWrapper.jab_types import (
     JavaObject,
 )
 from JABWrapper.jab_wrapper import JavaAccessBridgeWrapper
-from JABWrapper.parsers.parser_if import Parser
 
 
-class AccessibleTextParser(Parser):
+class AccessibleTextParser:
+    __slots__ = ("_aci", "_info", "_items", "_selection", "_attributes_info", "_rect_info")
+
     def __init__(self, aci: AccessibleContextInfo) -> None:
+        self.reset(aci)
+
+    def reset(self, aci: AccessibleContextInfo) -> None:
         self._aci = aci
-        self._info = AccessibleTextInfo()
-        self._items = AccessibleTextItemsInfo()
-        self._selection = AccessibleTextSelectionInfo()
-        self._attributes_info = AccessibleTextAttributesInfo()
-        self._rect_info = AccessibleTextRectInfo()
+        # The empty structures are only created when read, as most elements don't have text
+        self._info: Optional[AccessibleTextInfo] = None
+        self._items: Optional[AccessibleTextItemsInfo] = None
+        self._selection: Optional[AccessibleTextSelectionInfo] = None
+        self._attributes_info: Optional[AccessibleTextAttributesInfo] = None
+        self._rect_info: Optional[AccessibleTextRectInfo] = None
 
     def parse(self, jab_wrapper: JavaAccessBridgeWrapper, context: JavaObject) -> None:
         if self._aci.accessibleText:
@@ -28,11 +36,21 @@ class AccessibleTextParser(Parser):
             self._attributes_info = jab_wrapper.get_accessible_text_attributes(context, 0)
             self._rect_info = jab_wrapper.get_accessible_text_rect(context, 0)
 
+    def load(self, snapshot: AccessibleContextSnapshot) -> None:
+        if self._aci.accessibleText:
+            # Copied out, as the views would keep the whole snapshot alive
+            self._info = AccessibleTextInfo.from_buffer_copy(snapshot.textInfo)
+            self._items = AccessibleTextItemsInfo.from_buffer_copy(snapshot.textItems)
+            self._selection = AccessibleTextSelectionInfo.from_buffer_copy(snapshot.textSelection)
+            self._attributes_info = AccessibleTextAttributesInfo.from_buffer_copy(snapshot.textAttributes)
+            self._rect_info = AccessibleTextRectInfo.from_buffer_copy(snapshot.textRect)
+
     def __str__(self) -> str:
         if not self._aci.accessibleText:
             return ""
+        items = self.items
         return " tc={} w={} s={} st={};".format(
-            self._info.charCount, self._items.word, self._items.sentence, self._selection.selectedText
+            self.info.charCount, items.word, items.sentence, self.selection.selectedText
         )
 
     @property
@@ -47,6 +65,8 @@ class AccessibleTextParser(Parser):
                 "indexAtPoint": 2
             }
         """
+        if self._info is None:
+            self._info = AccessibleTextInfo()
         return self._info
 
     @info.setter
@@ -65,6 +85,8 @@ class AccessibleTextParser(Parser):
                 "sentence": "random word in a sentence"
             }
         """
+        if self._items is None:
+            self._items = AccessibleTextItemsInfo()
         return self._items
 
     @items.setter
@@ -83,6 +105,8 @@ class AccessibleTextParser(Parser):
                 "selectedText": "random"
             }
         """
+        if self._selection is None:
+            self._selection = AccessibleTextSelectionInfo()
         return self._selection
 
     @selection.setter
@@ -121,6 +145,8 @@ class AccessibleTextParser(Parser):
                 "fullAttributesString": "attrs",
             }
         """
+        if self._attributes_info is None:
+            self._attributes_info = AccessibleTextAttributesInfo()
         return self._attributes_info
 
     @attributes_info.setter
@@ -140,6 +166,8 @@ class AccessibleTextParser(Parser):
                 "height": 100
             }
         """
+        if self._rect_info is None:
+            self._rect_info = AccessibleTextRectInfo()
         return self._rect_info
 
     @rect_info.setter
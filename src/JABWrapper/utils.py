@@ -1,5 +1,8 @@
 import logging
+import sys
+import threading
 import time
+from typing import Optional
 
 CALLBACK_RETRIES = 10
 
@@ -10,7 +13,7 @@ def log_exec_time(name):
             start = time.perf_counter()
             func(*args, **kwargs)
             stop = time.perf_counter()
-            logging.debug(f"Executed {name} in {(stop - start):.04f}s")
+            logging.debug("Executed %s in %.04fs", name, stop - start)
 
         return exec_time
 
@@ -33,6 +36,8 @@ def retry_callback(func):
 
 
 class ReleaseEvent:
+    __slots__ = ("_context", "_vmID", "_name", "_event", "_source", "_start_exec")
+
     def __init__(self, context, vmID, name, event, source) -> None:
         self._context = context
         self._vmID = vmID
@@ -42,17 +47,134 @@ class ReleaseEvent:
         self._start_exec: float = 0
 
     def __enter__(self):
-        logging.debug(f"Received {self._name} event={self._source}")
+        logging.debug("Received %s event=%s", self._name, self._source)
         self._start_exec = time.perf_counter()
 
     def __exit__(self, type, value, traceback):
         stop_exec = time.perf_counter()
-        logging.debug(f"Executed {self._name} in {(stop_exec - self._start_exec):.04f}s")
+        logging.debug("Executed %s in %.04fs", self._name, stop_exec - self._start_exec)
         self._context._wab.releaseJavaObject(self._vmID, self._event)
 
 
 class SearchElement:
+    __slots__ = ("name", "value", "strict")
+
     def __init__(self, name, value, strict=False) -> None:
         self.name = name
-        self.value = value
+        self.value = sys.intern(value) if isinstance(value, str) else value
         self.strict = strict
+
+
+class _LockGuard:
+    __slots__ = ("_acquire", "_release")
+
+    def __init__(self, acquire, release) -> None:
+        self._acquire = acquire
+        self._release = release
+
+    def __enter__(self):
+        self._acquire()
+
+    def __exit__(self, type, value, traceback):
+        self._release()
+
+
+class ReadWriteLock:
+    """
+    Readers-writer lock. Multiple threads can read at the same time while writing is exclusive.
+
+    Both sides are reentrant for the holding thread and the writing thread can also read. A reading
+    thread can't start writing, as two readers doing that would deadlock each other. Waiting writers
+    are preferred over new readers so that the writers don't starve.
+
+    Usage:
+        with lock.read():
+            ...
+        with lock.write():
+            ...
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._waiting_writers = 0
+        self._writer: Optional[int] = None
+        self._write_depth = 0
+        self._local = threading.local()
+        self._read_guard = _LockGuard(self.acquire_read, self.release_read)
+        self._write_guard = _LockGuard(self.acquire_write, self.release_write)
+
+    def read(self) -> _LockGuard:
+        return self._read_guard
+
+    def write(self) -> _LockGuard:
+        return self._write_guard
+
+    def acquire_read(self) -> None:
+        local = self._local
+        depth = getattr(local, "depth", 0)
+        if depth:
+            local.depth = depth + 1
+            return
+        if self._writer == threading.get_ident():
+            # Reading within the own write lock, not counted as a reader
+            local.depth = 1
+            local.counted = False
+            return
+        with self._condition:
+            while self._writer is not None or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        local.depth = 1
+        local.counted = True
+
+    def release_read(self) -> None:
+        local = self._local
+        local.depth -= 1
+        if local.depth or not local.counted:
+            return
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        ident = threading.get_ident()
+        if self._writer == ident:
+            self._write_depth += 1
+            return
+        if getattr(self._local, "depth", 0):
+            raise RuntimeError("Can't acquire the write lock while holding the read lock")
+        with self._condition:
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = ident
+            self._write_depth = 1
+
+    def release_write(self) -> None:
+        self._write_depth -= 1
+        if self._write_depth:
+            return
+        with self._condition:
+            self._writer = None
+            self._condition.notify_all()
+
+
+class ExclusiveLock:
+    """
+    Plain lock, such as threading.RLock, with the read and write sides of ReadWriteLock. Both sides
+    take the same lock, so the readers are exclusive as well.
+    """
+
+    def __init__(self, lock) -> None:
+        self._lock = lock
+
+    def read(self):
+        return self._lock
+
+    def write(self):
+        return self._lock
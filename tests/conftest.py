@@ -1,3 +1,26 @@
+import ctypes
+import sys
+import types
+
+if sys.platform != "win32":
+    # The context tree is tested against the fake Access Bridge of the context tree reader on the other
+    # platforms as well. Only the Windows libraries that the wrapper loads on import are replaced there.
+
+    class _Library:
+        def __getattr__(self, name):
+            function = types.SimpleNamespace()
+            setattr(self, name, function)
+            return function
+
+    ctypes.windll = types.SimpleNamespace(user32=_Library())
+    ctypes.WINFUNCTYPE = ctypes.CFUNCTYPE
+    ctypes.WinError = OSError
+    sys.modules.setdefault("win32process", types.ModuleType("win32process"))
+
+    # The end-to-end tests need the Java test application and the Access Bridge
+    collect_ignore = ["test_jab_wrapper.py"]
+
+
 def pytest_addoption(parser):
     parser.addoption(
         "--simple", action="store_true", help="Test a single title-based scenario, where callbacks are off."
@@ -0,0 +1,405 @@
+import gc
+import sys
+import threading
+from collections import Counter
+from typing import Optional
+
+import pytest
+
+from JABWrapper.context_tree import ContextNode, ContextTree, SearchElement
+from JABWrapper.context_tree_reader import (
+    MATCH_OPTION,
+    FakeJabWrapper,
+    LocatorSimulator,
+    Node,
+    Row,
+    parse_output,
+)
+
+DUMP = """\
+role:frame; name:Chat; virtual_accessible_name:Chat; description:; ancestry:0
+| role:root pane; name:; virtual_accessible_name:; description:; ancestry:1
+| | role:panel; name:p1; virtual_accessible_name:p1; description:; ancestry:2
+| | | role:push button; name:Send; virtual_accessible_name:Send; description:; ancestry:3
+| | | role:push button; name:Clear; virtual_accessible_name:Clear; description:; ancestry:3
+| | | role:text; name:Area; virtual_accessible_name:Area; description:; ancestry:3
+| | role:menu bar; name:; virtual_accessible_name:; description:; ancestry:2
+| | | role:menu; name:FILE; virtual_accessible_name:FILE; description:; ancestry:3
+| | | | role:menu item; name:Exit; virtual_accessible_name:Exit; description:; ancestry:4
+"""
+
+
+class RecordingJabWrapper(FakeJabWrapper):
+    """
+    Fake Access Bridge that counts the calls and takes the callbacks when they are enabled.
+    """
+
+    def __init__(self, tree, callbacks: bool = False):
+        super().__init__(tree)
+        self.ignore_callbacks = not callbacks
+        self.callbacks = {}
+        self.calls = Counter()
+        self.threads = set()
+
+    def clear_callbacks(self):
+        self.callbacks = {}
+
+    def register_callbacks(self, callbacks):
+        self.callbacks.update(callbacks)
+
+    def get_context_snapshot(self, context):
+        self.calls["get_context_snapshot"] += 1
+        self.threads.add(threading.current_thread().name)
+        return super().get_context_snapshot(context)
+
+    def get_child_contexts(self, context, start_index, count):
+        self.calls["get_child_contexts"] += 1
+        return super().get_child_contexts(context, start_index, count)
+
+    def is_same_object(self, first, second):
+        return getattr(first, "element", first) is getattr(second, "element", second)
+
+    def get_accessible_icons(self, context):
+        self.calls["get_accessible_icons"] += 1
+        return super().get_accessible_icons(context)
+
+
+class Handle:
+    """
+    Another handle for the same fake element, like the event sources of the Access Bridge.
+    """
+
+    def __init__(self, element: Node, value: Optional[int] = None):
+        self.element = element
+        self.value = id(self) if value is None else value
+
+    def __getattr__(self, name):
+        return getattr(self.element, name)
+
+
+def _fake_tree():
+    return parse_output(DUMP.splitlines())
+
+
+def _find(node: Node, name: str) -> Node:
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.info.name == name:
+            return node
+        stack.extend(node.children)
+    raise LookupError(name)
+
+
+def _replace_child(old: Node, line: str) -> Node:
+    new = Node(Row(line))
+    new.parent = old.parent
+    siblings = old.parent.children
+    siblings[siblings.index(old)] = new
+    return new
+
+
+def _names(nodes):
+    return [node.context_info.name for node in nodes]
+
+
+def test_lazy_children_are_parsed_on_first_access():
+    fake_tree = _fake_tree()
+    jab_wrapper = RecordingJabWrapper(fake_tree)
+    context_tree = ContextTree(jab_wrapper, lazy_children=True)
+    assert jab_wrapper.calls["get_child_contexts"] == 0
+
+    assert _names(context_tree.root.children) == [""]
+    assert jab_wrapper.calls["get_child_contexts"] == 1
+    assert _names(context_tree.get_by_attrs([SearchElement("name", "Exit")])) == ["Exit"]
+    assert repr(context_tree) == repr(ContextTree(FakeJabWrapper(fake_tree)))
+
+
+def test_concurrent_readers_parse_the_lazy_children_once():
+    fake_tree = _fake_tree()
+    jab_wrapper = RecordingJabWrapper(fake_tree)
+    context_tree = ContextTree(jab_wrapper, lazy_children=True, lazy_details=True)
+    # The lazy parsing of unrelated trees doesn't wait for each other
+    other_tree = ContextTree(FakeJabWrapper(fake_tree), lazy_children=True, lazy_details=True)
+    assert context_tree.root._children_lock is not other_tree.root._children_lock
+    assert context_tree.root._details_lock is not other_tree.root._details_lock
+
+    barrier = threading.Barrier(4, timeout=5)
+    reprs = []
+
+    def reader():
+        barrier.wait()
+        reprs.append(repr(context_tree))
+
+    threads = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert reprs == [repr(ContextTree(FakeJabWrapper(fake_tree)))] * 4
+    assert jab_wrapper.calls["get_child_contexts"] == len(DUMP.splitlines())
+    assert jab_wrapper.calls["get_accessible_icons"] == len(DUMP.splitlines())
+
+
+def test_lazy_details_are_queried_on_first_access():
+    jab_wrapper = RecordingJabWrapper(_fake_tree())
+    context_tree = ContextTree(jab_wrapper, lazy_details=True)
+    assert jab_wrapper.calls["get_accessible_icons"] == 0
+
+    context_tree.root.icons
+    context_tree.root.icons
+    assert jab_wrapper.calls["get_accessible_icons"] == 1
+
+
+def test_lazy_details_are_queried_again_after_reparsing():
+    fake_tree = _fake_tree()
+    jab_wrapper = RecordingJabWrapper(fake_tree, callbacks=True)
+    context_tree = ContextTree(jab_wrapper, lazy_details=True)
+    # The searches only need the element info
+    area = context_tree.get_by_attrs([SearchElement("name", "Area")])[0]
+    context_tree.get_search_element_tree()
+    assert jab_wrapper.calls["get_accessible_icons"] == 0
+
+    area.icons
+    jab_wrapper.callbacks["property_text_change"](_find(fake_tree.root, "Area"))
+    assert jab_wrapper.calls["get_accessible_icons"] == 1
+    area.icons
+    assert jab_wrapper.calls["get_accessible_icons"] == 2
+
+    eager_wrapper = RecordingJabWrapper(fake_tree)
+    ContextTree(eager_wrapper)
+    assert eager_wrapper.calls["get_accessible_icons"] == len(DUMP.splitlines())
+
+
+def test_nodes_dont_keep_the_context_snapshot():
+    context_tree = ContextTree(FakeJabWrapper(_fake_tree()))
+    for node in context_tree:
+        assert node.context_info._b_base_ is None
+        assert node.keybinds.keybinds._b_base_ is None
+
+
+def test_parallel_build_matches_serial_build():
+    fake_tree = _fake_tree()
+    context_tree = ContextTree(FakeJabWrapper(fake_tree), workers=2, parallel_depth=1)
+    try:
+        assert repr(context_tree) == repr(ContextTree(FakeJabWrapper(fake_tree)))
+    finally:
+        context_tree.shutdown()
+
+
+def test_sibling_subtrees_are_built_by_the_workers():
+    fake_tree = _fake_tree()
+    jab_wrapper = RecordingJabWrapper(fake_tree)
+    context_tree = ContextTree(jab_wrapper, workers=2, parallel_depth=2)
+    try:
+        # The menu bar subtree is forked to a worker while the panel is built on the calling thread
+        assert threading.current_thread().name in jab_wrapper.threads
+        assert any(name.startswith("ContextTree") for name in jab_wrapper.threads)
+        assert jab_wrapper.calls["get_context_snapshot"] == len(DUMP.splitlines())
+        # Only the elements above the parallel depth keep the executor
+        assert [node.ancestry for node in context_tree if node._executor is not None] == [0, 1]
+    finally:
+        context_tree.shutdown()
+
+
+def test_search_matches_node_search():
+    context_tree = ContextTree(FakeJabWrapper(_fake_tree()))
+    searches = [
+        [SearchElement("role", "push button")],
+        [SearchElement("role", "push.*|menu item")],
+        [SearchElement("role", "push button"), SearchElement("name", "C.*")],
+        [SearchElement("name", "Clear", strict=True)],
+        [SearchElement("virtual_accessible_name", "Area")],
+        [SearchElement("role", "check box")],
+    ]
+    for search_elements in searches:
+        assert _names(context_tree.get_by_attrs(search_elements)) == _names(
+            context_tree.root.get_by_attrs(search_elements)
+        )
+    assert _names(context_tree.get_by_attrs(searches[1])) == ["Send", "Clear", "Exit"]
+    columns = context_tree.get_search_element_columns()
+    assert columns["name"] == _names(context_tree)
+    assert columns["ancestry"] == [0, 1, 2, 3, 3, 3, 2, 3, 4]
+
+
+def test_shallow_refresh_reparses_only_the_changed_elements():
+    fake_tree = _fake_tree()
+    jab_wrapper = RecordingJabWrapper(fake_tree)
+    context_tree = ContextTree(jab_wrapper)
+    unchanged = context_tree.get_by_attrs([SearchElement("name", "Send")])[0]
+    jab_wrapper.calls.clear()
+
+    _find(fake_tree.root, "Clear").info.name = "Reset"
+    context_tree.refresh(deep=False)
+    assert jab_wrapper.calls["get_context_snapshot"] == 1
+    assert _names(context_tree.get_by_attrs([SearchElement("role", "push button")])) == ["Send", "Reset"]
+    assert context_tree.get_by_attrs([SearchElement("name", "Send")])[0] is unchanged
+
+
+def test_shallow_refresh_picks_up_replaced_children():
+    fake_tree = _fake_tree()
+    context_tree = ContextTree(FakeJabWrapper(fake_tree))
+
+    _replace_child(
+        _find(fake_tree.root, "Exit"),
+        "| | | | role:menu item; name:Quit; virtual_accessible_name:Quit; description:; ancestry:4",
+    )
+    context_tree.refresh(deep=False)
+    assert _names(context_tree.get_by_attrs([SearchElement("role", "menu item")])) == ["Quit"]
+    assert repr(context_tree) == repr(ContextTree(FakeJabWrapper(fake_tree)))
+
+
+def test_debounced_events_update_the_element_once():
+    fake_tree = _fake_tree()
+    jab_wrapper = RecordingJabWrapper(fake_tree, callbacks=True)
+    context_tree = ContextTree(jab_wrapper, debounce=0.05)
+    source = _find(fake_tree.root, "Area")
+    jab_wrapper.calls.clear()
+
+    source.info.name = "Typed"
+    jab_wrapper.callbacks["property_text_change"](source)
+    flush_timer = context_tree._flush_timer
+    for _ in range(2):
+        jab_wrapper.callbacks["property_text_change"](source)
+    flush_timer.join()
+    assert jab_wrapper.calls["get_context_snapshot"] == 1
+    assert _names(context_tree.get_by_attrs([SearchElement("role", "text")])) == ["Typed"]
+
+
+def test_events_resolve_the_source_element():
+    fake_tree = _fake_tree()
+    jab_wrapper = RecordingJabWrapper(fake_tree, callbacks=True)
+    context_tree = ContextTree(jab_wrapper)
+    send = _find(fake_tree.root, "Send")
+    clear = _find(fake_tree.root, "Clear")
+
+    # A new handle of the element and a reused handle value of another element
+    jab_wrapper.callbacks["property_name_change"](Handle(send), "Send", "Post")
+    jab_wrapper.callbacks["property_name_change"](Handle(clear, value=send.value), "Clear", "Reset")
+    assert _names(context_tree.get_by_attrs([SearchElement("role", "push button")])) == ["Post", "Reset"]
+
+
+def test_debounced_events_of_new_source_handles_are_coalesced():
+    fake_tree = _fake_tree()
+    jab_wrapper = RecordingJabWrapper(fake_tree, callbacks=True)
+    context_tree = ContextTree(jab_wrapper, debounce=0.05)
+    source = _find(fake_tree.root, "Area")
+    jab_wrapper.calls.clear()
+
+    source.info.name = "Typed"
+    jab_wrapper.callbacks["property_text_change"](Handle(source))
+    flush_timer = context_tree._flush_timer
+    for _ in range(2):
+        jab_wrapper.callbacks["property_text_change"](Handle(source))
+    flush_timer.join()
+    assert jab_wrapper.calls["get_context_snapshot"] == 1
+    assert _names(context_tree.get_by_attrs([SearchElement("role", "text")])) == ["Typed"]
+
+
+def test_visible_data_change_picks_up_replaced_children():
+    fake_tree = _fake_tree()
+    jab_wrapper = RecordingJabWrapper(fake_tree, callbacks=True)
+    context_tree = ContextTree(jab_wrapper)
+    send = _find(fake_tree.root, "Send")
+
+    # The panel keeps its info and children count while one of its buttons is swapped for a check box
+    send.info.name = "Send2"
+    _replace_child(
+        _find(fake_tree.root, "Clear"),
+        "| | | role:check box; name:New; virtual_accessible_name:New; description:; ancestry:3",
+    )
+    jab_wrapper.callbacks["property_visible_data_change"](Handle(send.parent))
+    assert _names(context_tree.get_by_attrs([SearchElement("role", "check box")])) == ["New"]
+    assert _names(context_tree.get_by_attrs([SearchElement("role", "push button")])) == ["Send2"]
+    assert repr(context_tree) == repr(ContextTree(FakeJabWrapper(fake_tree)))
+
+
+def test_debounced_updates_below_a_refreshed_element_are_folded_into_it():
+    fake_tree = _fake_tree()
+    jab_wrapper = RecordingJabWrapper(fake_tree, callbacks=True)
+    context_tree = ContextTree(jab_wrapper, debounce=0.05)
+    area = _find(fake_tree.root, "Area")
+    jab_wrapper.calls.clear()
+
+    area.info.name = "Typed"
+    jab_wrapper.callbacks["property_text_change"](Handle(area))
+    flush_timer = context_tree._flush_timer
+    jab_wrapper.callbacks["property_visible_data_change"](Handle(area.parent))
+    flush_timer.join()
+    # The panel and the changed text area below it are both parsed once
+    assert jab_wrapper.calls["get_context_snapshot"] == 2
+    assert _names(context_tree.get_by_attrs([SearchElement("role", "text")])) == ["Typed"]
+
+
+def test_reader_splits_the_context_tree_repr():
+    context_tree = ContextTree(FakeJabWrapper(_fake_tree()))
+    lines = repr(context_tree).splitlines()
+    for line in lines:
+        row = Row.__new__(Row)
+        assert row._parse_fields(line)
+        groups = MATCH_OPTION.search(line).groups()
+        assert (row.role, row.name, row.van, row.desc, row.ancestry) == (*groups[:4], int(groups[4]))
+    assert repr(ContextTree(FakeJabWrapper(parse_output(lines)))) == repr(context_tree)
+
+
+def test_tree_is_built_serially_after_shutdown():
+    fake_tree = _fake_tree()
+    context_tree = ContextTree(FakeJabWrapper(fake_tree), workers=2, parallel_depth=2)
+    lazy_tree = ContextTree(FakeJabWrapper(fake_tree), workers=2, parallel_depth=2, lazy_children=True)
+    context_tree.shutdown()
+    lazy_tree.shutdown()
+
+    _find(fake_tree.root, "Clear").info.name = "Reset"
+    context_tree.refresh()
+    expected = repr(ContextTree(FakeJabWrapper(fake_tree)))
+    assert repr(context_tree) == expected
+    assert repr(lazy_tree) == expected
+
+
+def test_node_takes_a_plain_lock():
+    fake_tree = _fake_tree()
+    node = ContextNode(FakeJabWrapper(fake_tree), fake_tree.root, threading.RLock())
+    node.refresh(deep=False)
+    assert _names(node.get_by_attrs([SearchElement("role", "push button")])) == ["Send", "Clear"]
+    assert repr(node) == repr(ContextTree(FakeJabWrapper(fake_tree)))
+
+
+def test_deep_tree_is_walked_without_recursion():
+    depth = sys.getrecursionlimit() + 100
+    lines = [
+        f"{'| ' * ancestry}role:panel; name:p{ancestry}; virtual_accessible_name:; description:; ancestry:{ancestry}"
+        for ancestry in range(depth)
+    ]
+    context_tree = ContextTree(FakeJabWrapper(parse_output(lines)))
+    assert len(context_tree.root.get_search_element_tree()) == depth
+    assert len(context_tree.get_search_element_tree()) == depth
+    assert len(context_tree.root.get_by_attrs([SearchElement("role", "panel")])) == depth
+    context_tree.refresh(deep=False)
+
+
+def test_locator_simulator_indexes_the_found_elements(tmp_path):
+    element_tree = tmp_path / "element_tree.txt"
+    element_tree.write_text(DUMP)
+    simulator = LocatorSimulator(str(element_tree))
+    simulator.parse_element_tree()
+
+    assert _names(simulator._find_elements("role:push button")) == ["Send", "Clear"]
+    assert simulator._find_elements("role:push button", index=0).context_info.name == "Send"
+    assert simulator._find_elements("role:push button", index=1).context_info.name == "Clear"
+    with pytest.raises(AttributeError):
+        simulator._find_elements("role:push button", index=2)
+
+
+def test_parent_is_kept_by_the_tree_only():
+    fake_tree = _fake_tree()
+    context_tree = ContextTree(FakeJabWrapper(fake_tree))
+    send = context_tree.get_by_attrs([SearchElement("name", "Send")])[0]
+    del context_tree
+    gc.collect()
+    assert send.parent.context_info.name == "p1"
+
+    root = ContextNode(FakeJabWrapper(fake_tree), fake_tree.root)
+    send = root.get_by_attrs([SearchElement("name", "Send")])[0]
+    del root
+    gc.collect()
+    assert send.parent is None
@@ -0,0 +1,37 @@
+import sys
+from ctypes import sizeof
+
+import pytest
+
+from JABWrapper.jab_types import (
+    MAX_RELATIONS,
+    AccessibleRelationInfo,
+    AccessibleRelationSetInfo,
+    AccessibleTableCellInfo,
+    AccessibleTableInfo,
+    AccessibleTextAttributesInfo,
+    VisibleChildrenInfo,
+)
+
+
+def _fields_size(structure) -> int:
+    return sum(sizeof(field_type) for _, field_type in structure._fields_)
+
+
+# The wintypes sizes only match the Access Bridge headers on Windows
+@pytest.mark.skipif(sys.platform != "win32", reason="Windows only structure layouts")
+def test_text_attributes_info_has_no_padding():
+    assert sizeof(AccessibleTextAttributesInfo) == _fields_size(AccessibleTextAttributesInfo)
+
+
+def test_relation_set_info_holds_the_relations():
+    # The Access Bridge fills in up to MAX_RELATIONS relations, the buffer must have room for them
+    assert sizeof(AccessibleRelationSetInfo) >= sizeof(AccessibleRelationInfo) * MAX_RELATIONS
+    assert AccessibleRelationSetInfo().AccessibleRelationInfo[MAX_RELATIONS - 1].targetCount == 0
+
+
+def test_java_objects_are_naturally_aligned():
+    # The Access Bridge headers don't change the packing, the 64 bit handles after an int are padded to 8 bytes
+    assert VisibleChildrenInfo.children.offset == 8
+    assert AccessibleTableInfo.accessibleContext.offset == 24
+    assert AccessibleTableCellInfo.column.offset == 16
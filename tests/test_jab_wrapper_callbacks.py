@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+
+import pytest
+
+from JABWrapper import jab_wrapper as jab_wrapper_module
+from JABWrapper.jab_wrapper import _EVENTS, JavaAccessBridgeWrapper
+
+
+class RecordingAccessBridge:
+    """
+    Fake Access Bridge library that keeps the event function pointers set with the setXxxFP functions.
+    """
+
+    def __init__(self):
+        self.event_functions = {}
+
+    def __getattr__(self, name):
+        if not name.startswith("set"):
+            raise AttributeError(name)
+
+        def set_function(function):
+            self.event_functions[name] = function
+
+        return set_function
+
+    @property
+    def enabled(self):
+        return {name for name, function in self.event_functions.items() if function is not None}
+
+
+def _jab_wrapper() -> JavaAccessBridgeWrapper:
+    # Set up as in the wrapper init, without loading the Access Bridge
+    jab_wrapper = JavaAccessBridgeWrapper.__new__(JavaAccessBridgeWrapper)
+    jab_wrapper.ignore_callbacks = False
+    jab_wrapper._wab = RecordingAccessBridge()
+    jab_wrapper._context_callbacks = {}
+    jab_wrapper._set_callbacks()
+    return jab_wrapper
+
+
+def test_every_event_reaches_its_registered_callbacks():
+    source = object()
+    for name, (_, function_type, method_name) in _EVENTS.items():
+        received = []
+        jab_wrapper = SimpleNamespace(
+            _wab=SimpleNamespace(releaseJavaObject=lambda vm_id, event: None),
+            _context_callbacks={name: [lambda *args: received.append(args)]},
+        )
+        # The Access Bridge passes the VM id, the event and the source before the event specific values
+        values = [None] * (len(function_type._argtypes_) - 3)
+        getattr(JavaAccessBridgeWrapper, method_name)(jab_wrapper, 0, None, source, *values)
+        assert [args[0] for args in received] == [source], name
+
+
+def test_switching_the_window_disables_the_events(monkeypatch):
+    jab_wrapper = _jab_wrapper()
+    jab_wrapper.register_callbacks({"property_text_change": print, "focus_gained": print})
+    assert jab_wrapper._wab.enabled == {"setPropertyTextChangeFP", "setFocusGainedFP"}
+
+    # No windows are found, the callbacks are cleared before looking for them
+    user32 = SimpleNamespace(EnumWindows=lambda callback, param: 0)
+    monkeypatch.setattr(jab_wrapper_module, "windll", SimpleNamespace(user32=user32))
+    with pytest.raises(OSError):
+        jab_wrapper.switch_window_by_title("Chat")
+    assert jab_wrapper._wab.enabled == set()
+    assert jab_wrapper._context_callbacks == {}
+
+
+def test_events_are_enabled_by_their_first_callback():
+    jab_wrapper = _jab_wrapper()
+    assert jab_wrapper._wab.enabled == set()
+
+    jab_wrapper.register_callback("property_name_change", print)
+    jab_wrapper.register_callbacks({"property_name_change": print, "mouse_clicked": print})
+    assert jab_wrapper._wab.enabled == {"setPropertyNameChangeFP", "setMouseClickedFP"}
+    assert len(jab_wrapper._context_callbacks["property_name_change"]) == 2
+
+    jab_wrapper.clear_callbacks()
+    assert jab_wrapper._wab.enabled == set()
+    assert jab_wrapper._context_callbacks == {}
@@ -0,0 +1,61 @@
+import threading
+import time
+
+import pytest
+
+from JABWrapper.utils import ReadWriteLock
+
+
+def test_read_write_lock_allows_concurrent_readers():
+    lock = ReadWriteLock()
+    barrier = threading.Barrier(3, timeout=5)
+
+    def reader():
+        with lock.read():
+            # Every reader must be inside the lock at the same time to pass the barrier.
+            barrier.wait()
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not barrier.broken
+
+
+def test_read_write_lock_is_reentrant():
+    lock = ReadWriteLock()
+    with lock.write():
+        with lock.write():
+            with lock.read():
+                pass
+    with lock.read():
+        with lock.read():
+            pass
+        with pytest.raises(RuntimeError):
+            lock.acquire_write()
+
+
+def test_read_write_lock_prefers_waiting_writer():
+    lock = ReadWriteLock()
+    order = []
+
+    def writer():
+        with lock.write():
+            order.append("write")
+
+    def reader():
+        with lock.read():
+            order.append("read")
+
+    with lock.read():
+        writer_thread = threading.Thread(target=writer)
+        writer_thread.start()
+        time.sleep(0.05)
+        reader_thread = threading.Thread(target=reader)
+        reader_thread.start()
+        time.sleep(0.05)
+        assert order == []
+    writer_thread.join()
+    reader_thread.join()
+    assert order == ["write", "read"]